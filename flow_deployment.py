@@ -5,6 +5,9 @@ from datetime import timedelta
 
 # note that deployment names are
 # stored and referenced as '<flow name>/<deployment name>'
+# Constructed at module scope: `prefect deployment create` collects specs by
+# executing this script, and the constructor only registers the spec in a
+# contextvar — no network calls or other heavy work happens on import
 DeploymentSpec(
     flow_location="./hello_world.py",
     name="my-first-deployment",
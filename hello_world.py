@@ -1,30 +1,90 @@
+import asyncio
+import os
+import re
 from prefect import flow, task
 from typing import List
-import httpx
+
+try:
+    # Optional Rust-backed drop-in with the same API; moves TLS and HTTP
+    # parsing out of Python when installed
+    import httpxr as httpx
+except ImportError:
+    import httpx
 from prefect.deployments import DeploymentSpec
 from prefect.orion.schemas.schedules import CronSchedule
 
 
+# Shared connection pool; keeps TCP/TLS state warm across repos instead of
+# paying a fresh handshake per request
+_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    timeout=10.0,
+)
+
+
+# The repo payload has 100+ fields; we only need this one. The terminator
+# after the digits keeps a value truncated at a chunk boundary from matching
+_STAR_COUNT = re.compile(rb'"stargazers_count"\s*:\s*(\d+)[,}\s]')
+
+
 @task(retries=3)
-def get_stars(repo: str):
+async def get_stars(repo: str):
     url = f"https://api.github.com/repos/{repo}"
-    count = httpx.get(url).json()["stargazers_count"]
+    # Stream the response and stop reading as soon as the star count has been
+    # seen instead of downloading and parsing the whole ~20 KB document
+    async with _CLIENT.stream("GET", url) as response:
+        buffer = b""
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
+            match = _STAR_COUNT.search(buffer)
+            if match:
+                count = int(match.group(1))
+                break
+        else:
+            raise ValueError(f"No star count found for {repo!r}")
     print(f"{repo} has {count} stars!")
 
 
+@task(retries=3)
+async def get_stars_batch(repos: List[str]):
+    # Fold every lookup into one aliased GraphQL query — a single round trip
+    # instead of one request per repo. Requires an authenticated request.
+    fields = []
+    for i, repo in enumerate(repos):
+        owner, name = repo.split("/")
+        fields.append(
+            f'r{i}: repository(owner:"{owner}", name:"{name}") {{ stargazerCount }}'
+        )
+    query = "{" + " ".join(fields) + "}"
+
+    response = await _CLIENT.post(
+        "https://api.github.com/graphql",
+        json={"query": query},
+        headers={"Authorization": f"Bearer {os.environ['GITHUB_TOKEN']}"},
+    )
+    data = response.json()["data"]
+    for i, repo in enumerate(repos):
+        print(f"{repo} has {data[f'r{i}']['stargazerCount']} stars!")
+
+
 @flow(name="Github Stars")
-def github_stars(repos: List[str]):
-    for repo in repos:
-        get_stars(repo)
+async def github_stars(repos: List[str]):
+    if os.environ.get("GITHUB_TOKEN"):
+        # One batched query for all repos
+        await get_stars_batch(repos)
+    else:
+        # Unauthenticated fallback: one request per repo, submitted all at once
+        # so the HTTP round-trips overlap
+        await asyncio.gather(*(get_stars(repo) for repo in repos))
 
 
 # deployment names are stored and referenced as '<flow name>/<deployment name>'
+# Constructed at module scope: `prefect deployment create` collects specs by
+# executing this script, and the constructor only registers the spec in a
+# contextvar — no network calls or other heavy work happens on import
 DeploymentSpec(
     flow=github_stars,
     name="my-first-deployment",
     parameters={"repos": ["PrefectHQ/Prefect", "PrefectHQ/miter-design"]},
     schedule=CronSchedule(cron="0 7-22 * * 5"),
 )
-
-
-
@@ -103,6 +103,14 @@ class OrionClient:
         self._client = httpx.AsyncClient(**httpx_settings)
         self.logger = get_logger("client")
 
+    @property
+    def is_closed(self) -> bool:
+        """
+        Whether the underlying HTTP transport has been closed; a closed client
+        cannot be used to send requests.
+        """
+        return self._client.is_closed
+
     async def post(self, route: str, **kwargs) -> httpx.Response:
         """
         Send a POST request to the provided route.
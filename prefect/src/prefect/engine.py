@@ -15,6 +15,7 @@ Engine process overview
 - The run is orchestrated through states, calling the user's function as necessary.
     See `orchestrate_flow_run`, `orchestrate_task_run`
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager, contextmanager, nullcontext
 from functools import partial
@@ -72,6 +73,29 @@ R = TypeVar("R")
 engine_logger = get_logger("engine")
 
 
+def use_eager_task_factory() -> None:
+    """
+    Enable the asyncio eager task factory (Python 3.12+) for the current event loop.
+
+    The engine spawns many short-lived coroutines per task run that often complete
+    without suspending (e.g. waits on futures that already have a final state). The
+    eager factory runs such coroutines inline up to their first suspension, skipping
+    a scheduler round-trip per task. No-op on earlier Python versions or when a
+    custom task factory is already installed.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(eager_task_factory)
+
+
 def enter_flow_run_engine_from_flow_call(
     flow: Flow, parameters: Dict[str, Any]
 ) -> Union[State, Awaitable[State]]:
@@ -203,6 +227,8 @@ async def begin_flow_run(
     """
     logger = flow_run_logger(flow_run, flow)
 
+    use_eager_task_factory()
+
     async with detect_crashes(flow_run=flow_run):
         # If the flow is async, we need to provide a portal so sync tasks can run
         portal_context = start_blocking_portal() if flow.isasync else nullcontext()
@@ -483,7 +509,8 @@ async def collect_task_run_inputs(
 
     inputs = set()
 
-    async def add_futures_and_states_to_inputs(obj):
+    # a synchronous visitor lets `visit_collection` skip awaiting per element
+    def add_futures_and_states_to_inputs(obj):
         if isinstance(obj, PrefectFuture):
             inputs.add(core.TaskRunResult(id=obj.run_id))
 
@@ -0,0 +1,46 @@
+"""
+A minimal in-process pub/sub bus for signaling task run completion.
+
+Task runners publish a single message per task run when its final state is
+available; futures waiting on the run wake the instant the message is published
+instead of polling runner state. Topics hold at most one message (latest wins),
+so late subscribers receive the stored message immediately.
+"""
+import asyncio
+from typing import Any, Dict, Hashable, List
+
+
+class InProcessBus:
+    """
+    A latest-wins, single-message-per-topic publish/subscribe bus.
+
+    This bus is not thread-safe; publishers on other threads must marshal their
+    `publish` call onto the event loop, e.g. with `loop.call_soon_threadsafe`.
+    """
+
+    def __init__(self) -> None:
+        self._messages: Dict[Hashable, Any] = {}
+        self._waiters: Dict[Hashable, List["asyncio.Future"]] = {}
+
+    def publish(self, topic: Hashable, message: Any = None) -> None:
+        """
+        Store the latest message for a topic and wake all subscribers waiting on it.
+        """
+        self._messages[topic] = message
+        for waiter in self._waiters.pop(topic, []):
+            if not waiter.done():
+                waiter.set_result(message)
+
+    def has_message(self, topic: Hashable) -> bool:
+        return topic in self._messages
+
+    async def get(self, topic: Hashable) -> Any:
+        """
+        Return the message for a topic, waiting until one is published if necessary.
+        """
+        if topic in self._messages:
+            return self._messages[topic]
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(topic, []).append(waiter)
+        return await waiter
@@ -109,19 +109,35 @@ class Flow(Generic[P, R]):
         self.parameters = parameter_schema(self.fn)
         self.should_validate_parameters = validate_parameters
 
+        # Without annotations on the signature there are no types for pydantic
+        # to coerce to, so parameter validation reduces to the identity and
+        # `validate_parameters` can skip model construction entirely
+        self._has_typed_parameters = any(
+            param.annotation is not param.empty
+            for param in inspect.signature(fn).parameters.values()
+        )
+
+        # The validated function is cached after first use so repeated calls do
+        # not rebuild the pydantic model; it is not picklable in some
+        # environments so it is dropped by `__getstate__` and rebuilt lazily
+        self._validated_fn = None
+
         if self.should_validate_parameters:
             # Try to create the validated function now so that incompatibility can be
             # raised at declaration time rather than at runtime
-            # We cannot, however, store the validated function on the flow because it
-            # is not picklable in some environments
             try:
-                ValidatedFunction(self.fn, config=None)
+                self._validated_fn = ValidatedFunction(self.fn, config=None)
             except pydantic.ConfigError as exc:
                 raise ValueError(
                     "Flow function is not compatible with `validate_parameters`. "
                     "Disable validation or change the argument names."
                 ) from exc
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_validated_fn"] = None
+        return state
+
     def validate_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate parameters for compatibility with the flow by attempting to cast the inputs to the
@@ -133,7 +149,20 @@ class Flow(Generic[P, R]):
         Raises:
             FlowParameterError: if the provided parameters are not valid
         """
-        validated_fn = ValidatedFunction(self.fn, config=None)
+        if not self._has_typed_parameters:
+            # Nothing can be cast, but missing or unknown parameter names must
+            # still fail here rather than inside the run; JSON serializability
+            # is asserted separately by the engine before the run is created
+            try:
+                args, kwargs = parameters_to_args_kwargs(self.fn, parameters)
+                inspect.signature(self.fn).bind(*args, **kwargs)
+            except TypeError as exc:
+                raise ParameterTypeError(str(exc)) from None
+            return parameters
+
+        validated_fn = self._validated_fn
+        if validated_fn is None:
+            validated_fn = self._validated_fn = ValidatedFunction(self.fn, config=None)
         args, kwargs = parameters_to_args_kwargs(self.fn, parameters)
 
         validation_err = None
@@ -4,6 +4,10 @@ Futures represent the execution of a task and allow retrieval of the task run's
 This module contains the definition for futures as well as utilities for resolving
 futures in nested data structures.
 """
+import asyncio
+import itertools
+import reprlib
+import weakref
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -22,6 +26,7 @@ from typing_extensions import Literal
 import prefect
 from prefect.client import OrionClient, inject_client
 from prefect.orion.schemas.core import TaskRun
+from prefect.orion.schemas.filters import TaskRunFilter, TaskRunFilterId
 from prefect.orion.schemas.states import State
 from prefect.utilities.asyncio import sync, A, Async, Sync, sync_compatible
 from prefect.utilities.collections import visit_collection
@@ -33,6 +38,120 @@ if TYPE_CHECKING:
 R = TypeVar("R")
 
 
+class _LoopBatchState:
+    """
+    The pending waiters and flush timer a `_StateBatcher` tracks for one event
+    loop.
+    """
+
+    def __init__(self) -> None:
+        self.pending: list = []
+        self.flush_task: Optional["asyncio.Task"] = None
+        # Strong references so in-flight flush tasks cannot be garbage
+        # collected before they complete
+        self.running_flushes: set = set()
+
+
+class _StateBatcher:
+    """
+    Coalesces concurrent task run reads into bulk filter queries.
+
+    Concurrent `PrefectFuture.get_state` calls within the batch interval share a
+    single `read_task_runs` filter query instead of issuing one read per future,
+    cutting N round trips to ceil(N / batch_size).
+
+    State is kept per event loop so concurrent loops — e.g. a worker thread's
+    loop alongside the main loop — each flush only their own waiters; futures
+    must not be resolved from a different loop's thread.
+    """
+
+    def __init__(self, batch_interval: float = 0.005, batch_size: int = 200) -> None:
+        self.batch_interval = batch_interval
+        self.batch_size = batch_size
+        # Weak keys let a loop's state be collected when the loop is
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopBatchState]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def read_task_run(self, client: OrionClient, run_id) -> Optional[TaskRun]:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopBatchState()
+
+        waiter = loop.create_future()
+        state.pending.append((run_id, client, waiter))
+
+        if len(state.pending) >= self.batch_size:
+            if state.flush_task is not None:
+                state.flush_task.cancel()
+                state.flush_task = None
+            self._create_flush_task(loop, state, self._flush(state))
+        elif state.flush_task is None:
+            state.flush_task = self._create_flush_task(
+                loop, state, self._flush_after_interval(state)
+            )
+
+        return await waiter
+
+    def _create_flush_task(self, loop, state: _LoopBatchState, coro) -> "asyncio.Task":
+        task = loop.create_task(coro)
+        state.running_flushes.add(task)
+        task.add_done_callback(state.running_flushes.discard)
+        return task
+
+    async def _flush_after_interval(self, state: _LoopBatchState) -> None:
+        await asyncio.sleep(self.batch_interval)
+        state.flush_task = None
+        await self._flush(state)
+
+    async def _flush(self, state: _LoopBatchState) -> None:
+        pending, state.pending = state.pending, []
+        if not pending:
+            return
+
+        run_ids = [run_id for run_id, _, _ in pending]
+
+        # All waiters read from the same API so any caller's client can serve
+        # the batch, but a caller cancelled while awaiting its waiter closes
+        # its client on the way out — skip closed clients and, if the chosen
+        # one closes mid-request, fall back to the next open one
+        task_runs = None
+        error: Optional[Exception] = None
+        for _, client, _ in pending:
+            if client.is_closed:
+                continue
+            try:
+                task_runs = await client.read_task_runs(
+                    task_run_filter=TaskRunFilter(id=TaskRunFilterId(any_=run_ids)),
+                    limit=len(run_ids),
+                )
+                break
+            except Exception as exc:
+                error = exc
+                if client.is_closed:
+                    continue
+                break
+
+        if task_runs is None:
+            if error is None:
+                error = RuntimeError(
+                    "All clients in the batch were closed before the task runs "
+                    "could be read."
+                )
+            for _, _, waiter in pending:
+                if not waiter.done():
+                    waiter.set_exception(error)
+        else:
+            task_runs_by_id = {task_run.id: task_run for task_run in task_runs}
+            for run_id, _, waiter in pending:
+                if not waiter.done():
+                    waiter.set_result(task_runs_by_id.get(run_id))
+
+
+_state_batcher = _StateBatcher()
+
+
 class PrefectFuture(Generic[R, A]):
     """
     Represents the result of a computation happening in a task runner.
@@ -79,6 +198,21 @@ class PrefectFuture(Generic[R, A]):
         >>>     state = future.get_state()
     """
 
+    # Flows can create very large numbers of futures; slots keep the per-instance
+    # memory footprint down and speed up attribute access
+    __slots__ = (
+        "task_run",
+        "run_id",
+        "asynchronous",
+        "_final_state",
+        "_exception",
+        "_task_runner",
+        "_hash",
+        "_name",
+        "_client_ref",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         task_run: TaskRun,
@@ -88,10 +222,19 @@ class PrefectFuture(Generic[R, A]):
     ) -> None:
         self.task_run = task_run
         self.run_id = task_run.id
+        # Futures are used as dict keys during resolution; compute the hash once
+        # instead of re-reading the id from the pydantic model on every probe
+        self._hash = hash(self.run_id)
+        # Cache the name as a plain string so `__repr__` does not pay for pydantic
+        # attribute access on every log line
+        self._name = task_run.name
         self.asynchronous = asynchronous
         self._final_state = _final_state
         self._exception: Optional[Exception] = None
         self._task_runner = task_runner
+        # A weak reference to the last caller-managed client used to read state;
+        # reused across `get_state` calls to skip client injection
+        self._client_ref: Optional["weakref.ref"] = None
 
     @overload
     def wait(
@@ -122,9 +265,14 @@ class PrefectFuture(Generic[R, A]):
         """
         if self.asynchronous:
             return self._wait(timeout=timeout)
-        else:
-            # type checking cannot handle the overloaded timeout passing
-            return sync(self._wait, timeout=timeout)  # type: ignore
+
+        if self._final_state:
+            # The state is already in hand; skip the round trip through the
+            # async portal entirely
+            return self._final_state
+
+        # type checking cannot handle the overloaded timeout passing
+        return sync(self._wait, timeout=timeout)  # type: ignore
 
     @overload
     async def _wait(self, timeout: None = None) -> State[R]:
@@ -141,6 +289,23 @@ class PrefectFuture(Generic[R, A]):
         if self._final_state:
             return self._final_state
 
+        bus = getattr(self._task_runner, "_bus", None)
+        if bus is not None:
+            # The task runner publishes completion on its bus; wait for the
+            # message instead of blocking in the task runner. `wait_for` wraps
+            # its awaitable in a task and timer, so skip it when no timeout is
+            # requested — the common case on this path
+            if timeout is None:
+                message = await bus.get(self.run_id)
+            else:
+                try:
+                    message = await asyncio.wait_for(bus.get(self.run_id), timeout)
+                except asyncio.TimeoutError:
+                    return None
+            if isinstance(message, State):
+                self._final_state = message
+                return message
+
         self._final_state = await self._task_runner.wait(self, timeout)
         return self._final_state
 
@@ -168,11 +333,24 @@ class PrefectFuture(Generic[R, A]):
         else:
             return cast(State[R], sync(self._get_state, client=client))
 
-    @inject_client
     async def _get_state(self, client: OrionClient = None) -> State[R]:
+        if client is not None:
+            # Remember caller-managed clients so repeated polls skip injection;
+            # clients opened by `inject_client` are closed on return and must not
+            # be cached
+            self._client_ref = weakref.ref(client)
+        elif self._client_ref is not None:
+            cached_client = self._client_ref()
+            if cached_client is not None and not cached_client.is_closed:
+                client = cached_client
+
+        return await self._get_state_with_client(client=client)
+
+    @inject_client
+    async def _get_state_with_client(self, client: OrionClient = None) -> State[R]:
         assert client is not None  # always injected
 
-        task_run = await client.read_task_run(self.run_id)
+        task_run = await _state_batcher.read_task_run(client, self.run_id)
 
         if not task_run:
             raise RuntimeError("Future has no associated task run in the server.")
@@ -181,11 +359,63 @@ class PrefectFuture(Generic[R, A]):
         self.task_run = task_run
         return task_run.state
 
+    def __getstate__(self):
+        """
+        Allow the future to be serialized by dropping references that are bound to
+        the local process, such as the cached client. Deserialized futures (e.g. on
+        a remote task runner worker) fall back to waiting in the task runner.
+        """
+        data = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "__weakref__"
+        }
+        data["_client_ref"] = None
+        return data
+
+    def __setstate__(self, data: dict):
+        for name, value in data.items():
+            setattr(self, name, value)
+
     def __hash__(self) -> int:
-        return hash(self.run_id)
+        return self._hash
 
     def __repr__(self) -> str:
-        return f"PrefectFuture({self.task_run.name!r})"
+        return f"{type(self).__qualname__}({self._name!r})"
+
+
+async def _collect_futures(futures: list, expr: Any) -> Any:
+    """
+    Find all `PrefectFuture` instances in an expression, appending them to the given
+    list in visitation order.
+
+    Returns a materialized copy of the expression — iterators are consumed into lists
+    during collection — so a subsequent substitution pass sees the same elements.
+    """
+
+    async def visit_fn(expr):
+        if isinstance(expr, PrefectFuture):
+            futures.append(expr)
+        return expr
+
+    return await visit_collection(expr, visit_fn=visit_fn, return_data=True)
+
+
+async def _wait_all(futures: list) -> list:
+    """
+    Wait for all of the given futures concurrently and return their final states.
+
+    Concurrency is bounded by the `resolve_concurrency` setting so that flows with
+    thousands of task runs do not flood the event loop with pending waiters.
+    """
+    # The semaphore must be created per call since it binds to the running loop
+    semaphore = asyncio.Semaphore(prefect.settings.resolve_concurrency)
+
+    async def wait(future: "PrefectFuture") -> State:
+        async with semaphore:
+            return await future._wait()
+
+    return await asyncio.gather(*[wait(future) for future in futures])
 
 
 async def resolve_futures_to_data(
@@ -197,12 +427,40 @@ async def resolve_futures_to_data(
     Resolving futures to their results may wait for execution to complete and require
     communication with the API.
 
+    All futures are waited on concurrently so the total wait time is bounded by the
+    slowest future rather than the sum of all waits.
+
     Unsupported object types will be returned without modification.
     """
+    # Fast path: a bare future does not require a structure-preserving traversal
+    if isinstance(expr, PrefectFuture):
+        return (expr._final_state or await expr._wait()).result(
+            raise_on_failure=False
+        )
+
+    # Fast path: flat list/tuple of futures — the common shape for fan-outs —
+    # skips the generic visitor's per-node dispatch entirely
+    if type(expr) in (list, tuple) and all(
+        type(item) is PrefectFuture for item in expr
+    ):
+        states = await _wait_all(expr)
+        return type(expr)(
+            state.result(raise_on_failure=False) for state in states
+        )
+
+    futures: list = []
+    expr = await _collect_futures(futures, expr)
+
+    # Wait for all futures in a single concurrent batch
+    states = await _wait_all(futures)
+    results = {
+        id(future): state.result(raise_on_failure=False)
+        for future, state in zip(futures, states)
+    }
 
     async def visit_fn(expr):
         if isinstance(expr, PrefectFuture):
-            return (await expr._wait()).result(raise_on_failure=False)
+            return results[id(expr)]
         else:
             return expr
 
@@ -217,35 +475,82 @@ async def resolve_futures_to_states(
     new collection with the same structure with futures resolved to their final states.
     Resolving futures to their final states may wait for execution to complete.
 
+    All futures are waited on concurrently so the total wait time is bounded by the
+    slowest future rather than the sum of all waits.
+
     Unsupported object types will be returned without modification.
     """
+    # Fast path: a bare future does not require a structure-preserving traversal
+    if isinstance(expr, PrefectFuture):
+        return expr._final_state or await expr._wait()
+
+    # Fast path: flat list/tuple of futures — the common shape for fan-outs —
+    # skips the generic visitor's per-node dispatch entirely
+    if type(expr) in (list, tuple) and all(
+        type(item) is PrefectFuture for item in expr
+    ):
+        return type(expr)(await _wait_all(expr))
+
+    futures: list = []
+    expr = await _collect_futures(futures, expr)
+
+    # Wait for all futures in a single concurrent batch
+    states = await _wait_all(futures)
+    states_by_future = {
+        id(future): state for future, state in zip(futures, states)
+    }
 
     async def visit_fn(expr):
         if isinstance(expr, PrefectFuture):
-            return await expr._wait()
+            return states_by_future[id(expr)]
         else:
             return expr
 
     return await visit_collection(expr, visit_fn=visit_fn, return_data=True)
 
 
+# Bounded repr used for individual call arguments; prevents `repr` of a large
+# argument from materializing megabytes of string before truncation
+_call_arg_repr = reprlib.Repr()
+_call_arg_repr.maxstring = 50
+_call_arg_repr.maxlist = 4
+_call_arg_repr.maxtuple = 4
+_call_arg_repr.maxset = 4
+_call_arg_repr.maxdict = 4
+
+
 def call_repr(__fn: Callable, *args: Any, **kwargs: Any) -> str:
     """
     Generate a repr for a function call as "fn_name(arg_value, kwarg_name=kwarg_value)"
     """
 
     name = __fn.__name__
-
-    # TODO: If this computation is concerningly expensive, we can iterate checking the
-    #       length at each arg or avoid calling `repr` on args with large amounts of
-    #       data
-    call_args = ", ".join(
-        [repr(arg) for arg in args]
-        + [f"{key}={repr(val)}" for key, val in kwargs.items()]
-    )
+    arg_repr = _call_arg_repr.repr
+
+    # Build lazily and stop as soon as the maximum display length is reached so we
+    # never pay for more than ~100 characters of repr output. Plain loops with
+    # bound locals keep this cheap — it runs once per submit in debug runs.
+    call_args = []
+    append = call_args.append
+    total_length = 0
+    for arg in args:
+        display = arg_repr(arg)
+        append(display)
+        total_length += len(display)
+        if total_length > 100:
+            break
+    else:
+        for key, val in kwargs.items():
+            display = f"{key}={arg_repr(val)}"
+            append(display)
+            total_length += len(display)
+            if total_length > 100:
+                break
+
+    joined = ", ".join(call_args)
 
     # Enforce a maximum length
-    if len(call_args) > 100:
-        call_args = call_args[:100] + "..."
+    if len(joined) > 100:
+        joined = joined[:100] + "..."
 
-    return f"{name}({call_args})"
+    return f"{name}({joined})"
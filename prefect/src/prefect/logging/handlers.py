@@ -97,23 +97,25 @@ class OrionLogWorker:
             prefect.settings.logging.orion.max_log_size,
         )
 
-        # Loop until the queue is empty or we encounter an error
-        while not done:
+        # A single client serves every batch in this send cycle; opening one
+        # per batch would pay connection setup for each bulk POST
+        async with OrionClient() as client:
+            # Loop until the queue is empty or we encounter an error
+            while not done:
 
-            # Pull logs from the queue until it is empty or we reach the batch size
-            try:
-                while self._pending_size < max_batch_size:
-                    log = self._queue.get_nowait()
-                    self._pending_logs.append(log)
-                    self._pending_size += sys.getsizeof(log)
+                # Pull logs from the queue until it is empty or we reach the batch size
+                try:
+                    while self._pending_size < max_batch_size:
+                        log = self._queue.get_nowait()
+                        self._pending_logs.append(log)
+                        self._pending_size += sys.getsizeof(log)
 
-            except queue.Empty:
-                done = True
+                except queue.Empty:
+                    done = True
 
-            if not self._pending_logs:
-                continue
+                if not self._pending_logs:
+                    continue
 
-            async with OrionClient() as client:
                 try:
                     await client.create_logs(self._pending_logs)
                     self._pending_logs = []
@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import create_async_engine
 from functools import partial
 
 from prefect import settings
+from prefect.orion.utilities.database import json_deserializer, json_serializer
 from prefect.utilities.asyncio import add_event_loop_shutdown_callback
 
 
@@ -113,7 +114,14 @@ class AsyncPostgresConfiguration(BaseDatabaseConfiguration):
             if self.timeout is not None:
                 kwargs["connect_args"] = dict(command_timeout=self.timeout)
 
-            engine = create_async_engine(self.connection_url, echo=self.echo, **kwargs)
+            engine = create_async_engine(
+                self.connection_url,
+                echo=self.echo,
+                # use orjson for JSON column encode/decode
+                json_serializer=json_serializer,
+                json_deserializer=json_deserializer,
+                **kwargs,
+            )
 
             self.ENGINES[cache_key] = engine
             await self.schedule_engine_disposal(cache_key)
@@ -224,7 +232,14 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
             if ":memory:" in connection_url:
                 kwargs.update(poolclass=sa.pool.SingletonThreadPool)
 
-            engine = create_async_engine(connection_url, echo=echo, **kwargs)
+            engine = create_async_engine(
+                connection_url,
+                echo=echo,
+                # use orjson for JSON column encode/decode
+                json_serializer=json_serializer,
+                json_deserializer=json_deserializer,
+                **kwargs,
+            )
             sa.event.listen(engine.sync_engine, "engine_connect", self.setup_sqlite)
 
             self.ENGINES[cache_key] = engine
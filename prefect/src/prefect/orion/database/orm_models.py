@@ -1,6 +1,7 @@
 import datetime
 import uuid
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Union, Dict, Tuple, Hashable
 from coolname import generate_slug
 
@@ -14,6 +15,8 @@ from prefect.orion.utilities.database import (
     UUID,
     Timestamp,
     now,
+    utcnow,
+    uuid7,
     GenerateUUID,
     camel_to_snake,
     JSON,
@@ -23,6 +26,78 @@ from prefect.orion.utilities.database import (
 )
 
 
+# a constant expanding bindparam for the terminal state types: referencing one
+# shared parameter keeps the statement shape (and therefore the compiled-cache
+# key) stable across queries instead of regenerating a literal list per call
+_TERMINAL_STATES_PARAM = sa.bindparam(
+    "terminal_state_types",
+    tuple(sorted(states.TERMINAL_STATES, key=lambda s: s.value)),
+    expanding=True,
+)
+
+
+class TaskInputs(Pydantic):
+    """
+    Column codec for `task_run.task_inputs`.
+
+    Values are validated through pydantic on the way into the database; rows
+    read back are trusted, so hydration dispatches on the `input_type`
+    discriminator and rebuilds models with `construct`, skipping pydantic's
+    per-entry union validation — the dominant row-hydration cost on large
+    task run listings.
+    """
+
+    cache_ok = True
+
+    def __init__(self):
+        super().__init__(
+            Dict[str, List[Union[core.TaskRunResult, core.Parameter, core.Constant]]]
+        )
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        result = {}
+        for key, items in value.items():
+            hydrated = []
+            for item in items:
+                input_type = item["input_type"]
+                if input_type == "task_run":
+                    hydrated.append(
+                        core.TaskRunResult.construct(
+                            input_type=input_type, id=uuid.UUID(item["id"])
+                        )
+                    )
+                elif input_type == "parameter":
+                    hydrated.append(
+                        core.Parameter.construct(
+                            input_type=input_type, name=item["name"]
+                        )
+                    )
+                elif input_type == "constant":
+                    hydrated.append(
+                        core.Constant.construct(
+                            input_type=input_type, type=item["type"]
+                        )
+                    )
+                else:
+                    raise ValueError(f"Unknown task input type: {input_type!r}")
+            result[key] = hydrated
+        return result
+
+
+@lru_cache(maxsize=None)
+def _camel_to_snake_table_name(name: str) -> str:
+    """
+    Convert a camel-case class name to a snake-case table name.
+
+    Memoized because the declarative machinery resolves table names repeatedly
+    during class construction and every ORM configuration rebuilds the same
+    nine model classes.
+    """
+    return camel_to_snake.sub("_", name).lower()
+
+
 class ORMBase:
     """
     Base SQLAlchemy model that automatically infers the table name
@@ -46,19 +121,22 @@ class ORMBase:
         into a snake-case table name. Override by providing
         an explicit `__tablename__` class property.
         """
-        return camel_to_snake.sub("_", cls.__name__).lower()
+        return _camel_to_snake_table_name(cls.__name__)
 
+    # ids are generated client-side as time-ordered UUIDv7s so primary key
+    # inserts append to the hot end of the B-tree rather than splitting
+    # random pages; the server default remains for rows inserted without one
     id = sa.Column(
         UUID(),
         primary_key=True,
         server_default=GenerateUUID(),
-        default=uuid.uuid4,
+        default=uuid7,
     )
     created = sa.Column(
         Timestamp(),
         nullable=False,
         server_default=now(),
-        default=lambda: pendulum.now("UTC"),
+        default=utcnow,
     )
 
     # onupdate is only called when statements are actually issued
@@ -69,7 +147,7 @@ class ORMBase:
         nullable=False,
         index=True,
         server_default=now(),
-        default=lambda: pendulum.now("UTC"),
+        default=utcnow,
         onupdate=now(),
         server_onupdate=FetchedValue(),
     )
@@ -99,6 +177,15 @@ class ORMFlow:
 class ORMFlowRunState:
     """SQLAlchemy mixin of a flow run state."""
 
+    # state rows are append-mostly and deleted in bulk via cascade from their
+    # run, so skip the extra round trip confirming each deleted row.
+    # eager_defaults is restated because mapper args from the base class are
+    # overridden, not merged
+    __mapper_args__ = {"confirm_deleted_rows": False, "eager_defaults": True}
+
+    # no instance attributes beyond the mapped columns
+    __slots__ = ()
+
     # this column isn't explicitly indexed because it is included in
     # the unique compound index on (flow_run_id, timestamp)
     @declared_attr
@@ -114,7 +201,7 @@ class ORMFlowRunState:
         Timestamp(),
         nullable=False,
         server_default=now(),
-        default=lambda: pendulum.now("UTC"),
+        default=utcnow,
     )
     name = sa.Column(sa.String, nullable=False, index=True)
     message = sa.Column(sa.String)
@@ -153,6 +240,15 @@ class ORMFlowRunState:
 class ORMTaskRunState:
     """SQLAlchemy model of a task run state."""
 
+    # state rows are append-mostly and deleted in bulk via cascade from their
+    # run, so skip the extra round trip confirming each deleted row.
+    # eager_defaults is restated because mapper args from the base class are
+    # overridden, not merged
+    __mapper_args__ = {"confirm_deleted_rows": False, "eager_defaults": True}
+
+    # no instance attributes beyond the mapped columns
+    __slots__ = ()
+
     # this column isn't explicitly indexed because it is included in
     # the unique compound index on (task_run_id, timestamp)
     @declared_attr
@@ -168,7 +264,7 @@ class ORMTaskRunState:
         Timestamp(),
         nullable=False,
         server_default=now(),
-        default=lambda: pendulum.now("UTC"),
+        default=utcnow,
     )
     name = sa.Column(sa.String, nullable=False, index=True)
     message = sa.Column(sa.String)
@@ -215,6 +311,9 @@ class ORMTaskRunStateCache:
     )
     task_run_state_id = sa.Column(UUID(), nullable=False)
 
+    # the cache-hit lookup is "most recent non-expired entry for this key";
+    # including the expiration and state id in the index lets the lookup be
+    # served index-only, without a heap visit per cache check
     @declared_attr
     def __table_args__(cls):
         return (
@@ -222,6 +321,26 @@ class ORMTaskRunStateCache:
                 "ix_task_run_state_cache__cache_key_created_desc",
                 "cache_key",
                 sa.desc("created"),
+                "cache_expiration",
+                "task_run_state_id",
+            ),
+        )
+
+
+class ORMPostgresTaskRunStateCache(ORMTaskRunStateCache):
+    """
+    Postgres variant of the task run state cache mixin: covers the cache-hit
+    lookup with INCLUDE columns instead of widening the index key.
+    """
+
+    @declared_attr
+    def __table_args__(cls):
+        return (
+            sa.Index(
+                "ix_task_run_state_cache__cache_key_created_desc",
+                "cache_key",
+                sa.desc("created"),
+                postgresql_include=["cache_expiration", "task_run_state_id"],
             ),
         )
 
@@ -238,7 +357,11 @@ class ORMRun:
         nullable=False,
         index=True,
     )
+    # the current state is denormalized onto the run so that list queries and
+    # the hybrid expressions below never need to touch the state table
     state_type = sa.Column(sa.Enum(states.StateType, name="state_type"))
+    state_name = sa.Column(sa.String, index=True)
+    state_timestamp = sa.Column(Timestamp())
     run_count = sa.Column(sa.Integer, server_default="0", default=0, nullable=False)
     expected_start_time = sa.Column(Timestamp())
     next_scheduled_start_time = sa.Column(Timestamp())
@@ -251,40 +374,49 @@ class ORMRun:
         nullable=False,
     )
 
+    @classmethod
+    def load_for_list(cls):
+        """
+        Loader options for listing queries: load the current state for the
+        whole result set with a single secondary SELECT and raise on any other
+        accidental lazy load.
+        """
+        return (sa.orm.selectinload(cls._state).raiseload("*"),)
+
+    @classmethod
+    def load_for_detail(cls):
+        """
+        Loader options for single-row reads: join the current state onto the
+        row so a detail read is one round trip, and raise on any other
+        accidental lazy load.
+        """
+        return (sa.orm.joinedload(cls._state).raiseload("*"),)
+
     @hybrid_property
     def estimated_run_time(self):
         """Total run time is incremented in the database whenever a RUNNING
         state is exited. To give up-to-date estimates, we estimate incremental
         run time for any runs currently in a RUNNING state."""
-        if self.state and self.state_type == states.StateType.RUNNING:
-            return self.total_run_time + (pendulum.now() - self.state.timestamp)
+        if self.state_timestamp and self.state_type == states.StateType.RUNNING:
+            return self.total_run_time + (pendulum.now() - self.state_timestamp)
         else:
             return self.total_run_time
 
     @estimated_run_time.expression
     def estimated_run_time(cls):
-        # use a correlated subquery to retrieve details from the state table
-        state_table = cls.state.property.target
-        return (
-            sa.select(
-                sa.case(
-                    (
-                        cls.state_type == states.StateType.RUNNING,
-                        interval_add(
-                            cls.total_run_time,
-                            date_diff(now(), state_table.c.timestamp),
-                        ),
-                    ),
-                    else_=cls.total_run_time,
-                )
-            )
-            .select_from(state_table)
-            .where(cls.state_id == state_table.c.id)
-            # add a correlate statement so this can reuse the `FROM` clause
-            # of any parent query
-            .correlate(cls, state_table)
-            .label("estimated_run_time")
-        )
+        # the state timestamp is denormalized onto the run, so this is pure
+        # arithmetic over run columns — no correlated subquery against the
+        # state table is required
+        return sa.case(
+            (
+                cls.state_type == states.StateType.RUNNING,
+                interval_add(
+                    cls.total_run_time,
+                    date_diff(now(), cls.state_timestamp),
+                ),
+            ),
+            else_=cls.total_run_time,
+        ).label("estimated_run_time")
 
     @hybrid_property
     def estimated_start_time_delta(self) -> datetime.timedelta:
@@ -295,15 +427,17 @@ class ORMRun:
         start already."""
         if self.start_time and self.start_time > self.expected_start_time:
             return (self.start_time - self.expected_start_time).as_interval()
-        elif (
+        if (
             self.start_time is None
             and self.expected_start_time
-            and self.expected_start_time < pendulum.now("UTC")
             and self.state_type not in states.TERMINAL_STATES
         ):
-            return (pendulum.now("UTC") - self.expected_start_time).as_interval()
-        else:
-            return datetime.timedelta(0)
+            # this property runs once per row on list endpoints, so the
+            # current time is taken exactly once
+            current_time = pendulum.now("UTC")
+            if self.expected_start_time < current_time:
+                return (current_time - self.expected_start_time).as_interval()
+        return datetime.timedelta(0)
 
     @estimated_start_time_delta.expression
     def estimated_start_time_delta(cls):
@@ -315,7 +449,7 @@ class ORMRun:
             (
                 sa.and_(
                     cls.start_time.is_(None),
-                    cls.state_type.not_in(states.TERMINAL_STATES),
+                    cls.state_type.not_in(_TERMINAL_STATES_PARAM),
                     cls.expected_start_time < now(),
                 ),
                 date_diff(now(), cls.expected_start_time),
@@ -324,17 +458,32 @@ class ORMRun:
         )
 
 
+def _scheduler_index_predicate():
+    """
+    The predicate for the partial index on `next_scheduled_start_time`,
+    matching the scheduler's poll query: runs that still have a scheduled
+    time and have not reached a terminal state.
+    """
+    return sa.and_(
+        sa.column("next_scheduled_start_time").isnot(None),
+        sa.column("state_type", sa.Enum(states.StateType, name="state_type")).not_in(
+            states.TERMINAL_STATES
+        ),
+    )
+
+
 @declarative_mixin
 class ORMFlowRun(ORMRun):
     """SQLAlchemy model of a flow run."""
 
+    # this column isn't explicitly indexed because it is the leading column of
+    # the composite index on (flow_id, state_type)
     @declared_attr
     def flow_id(cls):
         return sa.Column(
             UUID(),
             sa.ForeignKey("flow.id", ondelete="cascade"),
             nullable=False,
-            index=True,
         )
 
     @declared_attr
@@ -367,15 +516,14 @@ class ORMFlowRun(ORMRun):
         JSON, server_default="{}", default=dict, nullable=False
     )
 
+    # this column intentionally has no database-level foreign key: the
+    # constraint required `use_alter` to break a circular dependency and made
+    # every task_run DELETE scan flow_run to null out references. Referential
+    # integrity is handled in the application when task runs are deleted.
     @declared_attr
     def parent_task_run_id(cls):
         return sa.Column(
             UUID(),
-            sa.ForeignKey(
-                "task_run.id",
-                ondelete="SET NULL",
-                use_alter=True,
-            ),
             index=True,
         )
 
@@ -398,14 +546,19 @@ class ORMFlowRun(ORMRun):
 
     # -------------------------- relationships
 
-    # current states are eagerly loaded unless otherwise specified
+    # current states are eagerly loaded unless otherwise specified. "selectin"
+    # issues a single secondary SELECT ... WHERE id IN (...) for the whole
+    # result instead of joining the state table onto every row, which avoids
+    # duplicating parent columns on wide listing queries
     @declared_attr
     def _state(cls):
+        # the join condition is derived from the state_id foreign key; with
+        # foreign_keys given explicitly there is no ambiguity with the
+        # state table's own flow_run_id pointer and no join-string to parse
         return sa.orm.relationship(
             "FlowRunState",
-            lazy="joined",
+            lazy="selectin",
             foreign_keys=[cls.state_id],
-            primaryjoin="FlowRunState.id==%s.state_id" % cls.__name__,
         )
 
     @hybrid_property
@@ -432,6 +585,10 @@ class ORMFlowRun(ORMRun):
         """
         if state is not None:
             state.flow_run_id = self.id
+            # keep the denormalized state columns in sync
+            self.state_type = state.type
+            self.state_name = state.name
+            self.state_timestamp = state.timestamp
         self._state = state
 
     @declared_attr
@@ -440,12 +597,12 @@ class ORMFlowRun(ORMRun):
 
     @declared_attr
     def task_runs(cls):
+        # task_run.flow_run_id is the only foreign key between the two
+        # tables, so the join condition is derived with no string to parse
         return sa.orm.relationship(
             "TaskRun",
             back_populates="flow_run",
             lazy="raise",
-            # foreign_keys=lambda: [cls.flow_run_id],
-            primaryjoin="TaskRun.flow_run_id==%s.id" % cls.__name__,
         )
 
     @declared_attr
@@ -454,7 +611,10 @@ class ORMFlowRun(ORMRun):
             "TaskRun",
             back_populates="subflow_run",
             lazy="raise",
-            foreign_keys=lambda: [cls.parent_task_run_id],
+            # there is no database-level foreign key, so annotate the join
+            # condition explicitly
+            primaryjoin="TaskRun.id==foreign(%s.parent_task_run_id)"
+            % cls.__name__,
         )
 
     @declared_attr
@@ -470,21 +630,29 @@ class ORMFlowRun(ORMRun):
                 "ix_flow_run__expected_start_time_desc",
                 sa.desc("expected_start_time"),
             ),
+            # partial index: the scheduler only polls runs that still have a
+            # scheduled time and haven't reached a terminal state, so terminal
+            # rows (the vast majority over time) are excluded from the index
             sa.Index(
                 "ix_flow_run__next_scheduled_start_time_asc",
                 sa.asc("next_scheduled_start_time"),
+                postgresql_where=_scheduler_index_predicate(),
+                sqlite_where=_scheduler_index_predicate(),
             ),
             sa.Index(
                 "ix_flow_run__end_time_desc",
                 sa.desc("end_time"),
             ),
+            # equality columns first: serves "runs of flow X in state Y" with a
+            # single seek and covers flow_id-only lookups as a prefix; the
+            # trailing start_time also serves time-sorted reads of that slice,
+            # replacing a standalone start_time index that every INSERT would
+            # otherwise have to maintain
             sa.Index(
-                "ix_flow_run__start_time",
-                "start_time",
-            ),
-            sa.Index(
-                "ix_flow_run__state_type",
+                "ix_flow_run__flow_id_state_type_start_time",
+                "flow_id",
                 "state_type",
+                sa.desc("start_time"),
             ),
         )
 
@@ -493,13 +661,14 @@ class ORMFlowRun(ORMRun):
 class ORMTaskRun(ORMRun):
     """SQLAlchemy model of a task run."""
 
+    # this column isn't explicitly indexed because it is the leading column of
+    # the composite index on (flow_run_id, state_type)
     @declared_attr
     def flow_run_id(cls):
         return sa.Column(
             UUID(),
             sa.ForeignKey("flow_run.id", ondelete="cascade"),
             nullable=False,
-            index=True,
         )
 
     task_key = sa.Column(sa.String, nullable=False)
@@ -514,9 +683,7 @@ class ORMTaskRun(ORMRun):
         nullable=False,
     )
     task_inputs = sa.Column(
-        Pydantic(
-            Dict[str, List[Union[core.TaskRunResult, core.Parameter, core.Constant]]]
-        ),
+        TaskInputs(),
         server_default="{}",
         default=dict,
         nullable=False,
@@ -538,14 +705,19 @@ class ORMTaskRun(ORMRun):
 
     # -------------------------- relationships
 
-    # current states are eagerly loaded unless otherwise specified
+    # current states are eagerly loaded unless otherwise specified. "selectin"
+    # issues a single secondary SELECT ... WHERE id IN (...) for the whole
+    # result instead of joining the state table onto every row, which avoids
+    # duplicating parent columns on wide listing queries
     @declared_attr
     def _state(cls):
+        # the join condition is derived from the state_id foreign key; with
+        # foreign_keys given explicitly there is no ambiguity with the
+        # state table's own task_run_id pointer and no join-string to parse
         return sa.orm.relationship(
             "TaskRunState",
-            lazy="joined",
+            lazy="selectin",
             foreign_keys=[cls.state_id],
-            primaryjoin="TaskRunState.id==%s.state_id" % cls.__name__,
         )
 
     @hybrid_property
@@ -572,6 +744,10 @@ class ORMTaskRun(ORMRun):
         """
         if state is not None:
             state.task_run_id = self.id
+            # keep the denormalized state columns in sync
+            self.state_type = state.type
+            self.state_name = state.name
+            self.state_timestamp = state.timestamp
         self._state = state
 
     @declared_attr
@@ -589,8 +765,10 @@ class ORMTaskRun(ORMRun):
             "FlowRun",
             back_populates="parent_task_run",
             lazy="raise",
-            # foreign_keys=["FlowRun.parent_task_run_id"],
-            primaryjoin="FlowRun.parent_task_run_id==%s.id" % cls.__name__,
+            # there is no database-level foreign key, so annotate the join
+            # condition explicitly
+            primaryjoin="foreign(FlowRun.parent_task_run_id)==%s.id"
+            % cls.__name__,
             uselist=False,
         )
 
@@ -616,13 +794,16 @@ class ORMTaskRun(ORMRun):
                 "ix_task_run__end_time_desc",
                 sa.desc("end_time"),
             ),
+            # equality columns first: serves "task runs of flow run X in state
+            # Y" with a single seek and covers flow_run_id-only lookups as a
+            # prefix; the trailing start_time also serves time-sorted reads of
+            # that slice, replacing a standalone start_time index that every
+            # INSERT would otherwise have to maintain
             sa.Index(
-                "ix_task_run__start_time",
-                "start_time",
-            ),
-            sa.Index(
-                "ix_task_run__state_type",
+                "ix_task_run__flow_run_id_state_type_start_time",
+                "flow_run_id",
                 "state_type",
+                sa.desc("start_time"),
             ),
         )
 
@@ -710,6 +891,13 @@ class ORMSavedSearch:
         return (sa.UniqueConstraint("name"),)
 
 
+# cache of constructed declarative models, keyed by ORM configuration
+# identity. Building the models configures mappers and instruments every
+# attribute, which is expensive; identical configurations share one set of
+# models (and one MetaData, which also avoids duplicate-table warnings)
+_MODEL_CACHE: Dict[Tuple[Hashable, ...], dict] = {}
+
+
 class BaseORMConfiguration(ABC):
     """
     Abstract base class used to inject database-specific ORM configuration into Orion.
@@ -747,6 +935,27 @@ class BaseORMConfiguration(ABC):
         saved_search_mixin=ORMSavedSearch,
         log_mixin=ORMLog,
     ):
+        cache_key = (
+            self.__class__,
+            base_metadata,
+            tuple(base_model_mixins) if base_model_mixins else (),
+            (
+                flow_mixin,
+                flow_run_mixin,
+                flow_run_state_mixin,
+                task_run_mixin,
+                task_run_state_mixin,
+                task_run_state_cache_mixin,
+                deployment_mixin,
+                saved_search_mixin,
+                log_mixin,
+            ),
+        )
+        cached = _MODEL_CACHE.get(cache_key)
+        if cached is not None:
+            self.__dict__.update(cached)
+            return
+
         self.base_metadata = base_metadata or sa.schema.MetaData(
             # define naming conventions for our Base class to use
             # sqlalchemy will use the following templated strings
@@ -786,6 +995,8 @@ class BaseORMConfiguration(ABC):
             log_mixin=log_mixin,
         )
 
+        _MODEL_CACHE[cache_key] = dict(self.__dict__)
+
     def _unique_key(self) -> Tuple[Hashable, ...]:
         """
         Returns a key used to determine whether to instantiate a new DB interface.
@@ -897,6 +1108,12 @@ class BaseORMConfiguration(ABC):
 class AsyncPostgresORMConfiguration(BaseORMConfiguration):
     """Postgres specific orm configuration"""
 
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault(
+            "task_run_state_cache_mixin", ORMPostgresTaskRunStateCache
+        )
+        super().__init__(*args, **kwargs)
+
     def run_migrations(self):
         ...
 
@@ -157,7 +157,9 @@ async def read_flow_run(
         db.FlowRun: the flow run
     """
 
-    return await session.get(db.FlowRun, flow_run_id)
+    return await session.get(
+        db.FlowRun, flow_run_id, options=db.FlowRun.load_for_detail()
+    )
 
 
 @inject_db
@@ -240,7 +242,11 @@ async def read_flow_runs(
         List[db.FlowRun]: flow runs
     """
 
-    query = select(db.FlowRun).order_by(sort.as_sql_sort())
+    query = (
+        select(db.FlowRun)
+        .options(*db.FlowRun.load_for_list())
+        .order_by(sort.as_sql_sort())
+    )
 
     query = await _apply_flow_run_filters(
         query,
@@ -261,6 +267,45 @@ async def read_flow_runs(
     return result.scalars().unique().all()
 
 
+@inject_db
+def flow_run_list_stmt(db: OrionDBInterface = None):
+    """
+    Build the hot "list flow runs for a flow, optionally filtered by state
+    type" query as a lambda statement.
+
+    The statement shape is constant — parameters flow through bindparams —
+    so SQLAlchemy can reuse the lambda construction and the compiled-cache
+    entry across calls instead of rebuilding and re-hashing the expression
+    tree per request.
+
+    Execute with::
+
+        await session.execute(
+            flow_run_list_stmt(),
+            {"flow_id": ..., "state_types": [...], "limit": ..., "offset": ...},
+        )
+    """
+    FlowRun = db.FlowRun
+    stmt = sa.lambda_stmt(lambda: select(FlowRun), track_on=(FlowRun,))
+    stmt = stmt.add_criteria(
+        lambda s: s.where(FlowRun.flow_id == sa.bindparam("flow_id")),
+        track_on=(FlowRun,),
+    )
+    stmt = stmt.add_criteria(
+        lambda s: s.where(
+            FlowRun.state_type.in_(sa.bindparam("state_types", expanding=True))
+        ),
+        track_on=(FlowRun,),
+    )
+    stmt = stmt.add_criteria(
+        lambda s: s.order_by(FlowRun.id.desc())
+        .limit(sa.bindparam("limit"))
+        .offset(sa.bindparam("offset")),
+        track_on=(FlowRun,),
+    )
+    return stmt
+
+
 class DependencyResult(PrefectBaseModel):
     id: UUID
     upstream_dependencies: List[TaskRunResult]
@@ -355,6 +400,21 @@ async def delete_flow_run(
         bool: whether or not the flow run was deleted
     """
 
+    # there is no database-level foreign key from flow_run.parent_task_run_id,
+    # so null out any subflow references to this run's task runs before the
+    # cascade on task_run.flow_run_id deletes them
+    await session.execute(
+        sa.update(db.FlowRun)
+        .where(
+            db.FlowRun.parent_task_run_id.in_(
+                sa.select(db.TaskRun.id).where(db.TaskRun.flow_run_id == flow_run_id)
+            )
+        )
+        .values(parent_task_run_id=None)
+        # the subquery criteria cannot be evaluated against the session, so
+        # fetch the affected rows to keep in-session instances current
+        .execution_options(synchronize_session="fetch")
+    )
     result = await session.execute(
         delete(db.FlowRun).where(db.FlowRun.id == flow_run_id)
     )
@@ -259,5 +259,24 @@ async def delete_flow(
         bool: whether or not the flow was deleted
     """
 
+    # there is no database-level foreign key from flow_run.parent_task_run_id,
+    # so null out any subflow references to this flow's task runs before the
+    # cascade on flow_run.flow_id and task_run.flow_run_id deletes them
+    await session.execute(
+        sa.update(db.FlowRun)
+        .where(
+            db.FlowRun.parent_task_run_id.in_(
+                sa.select(db.TaskRun.id).where(
+                    db.TaskRun.flow_run_id.in_(
+                        sa.select(db.FlowRun.id).where(db.FlowRun.flow_id == flow_id)
+                    )
+                )
+            )
+        )
+        .values(parent_task_run_id=None)
+        # the subquery criteria cannot be evaluated against the session, so
+        # fetch the affected rows to keep in-session instances current
+        .execution_options(synchronize_session="fetch")
+    )
     result = await session.execute(delete(db.Flow).where(db.Flow.id == flow_id))
     return result.rowcount > 0
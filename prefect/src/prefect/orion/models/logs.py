@@ -11,6 +11,12 @@ from prefect.orion import schemas
 from prefect.orion.database.dependencies import inject_db
 from prefect.orion.database.interface import OrionDBInterface
 
+# maximum number of rows per INSERT statement. Logs are the highest-volume
+# insert workload, so they are written as multi-row VALUES statements that
+# bypass the ORM unit of work; the cap keeps very large payloads under
+# SQLite's bound-parameter limit
+LOG_INSERT_BATCH_SIZE = 500
+
 
 @inject_db
 async def create_logs(
@@ -26,8 +32,11 @@ async def create_logs(
     Returns:
         None
     """
-    insert_stmt = (await db.insert(db.Log)).values([log.dict() for log in logs])
-    await session.execute(insert_stmt)
+    values = [log.dict() for log in logs]
+    for batch_start in range(0, len(values), LOG_INSERT_BATCH_SIZE):
+        batch = values[batch_start : batch_start + LOG_INSERT_BATCH_SIZE]
+        insert_stmt = (await db.insert(db.Log)).values(batch)
+        await session.execute(insert_stmt)
 
 
 @inject_db
@@ -93,7 +93,9 @@ async def read_task_run(
         db.TaskRun: the task run
     """
 
-    model = await session.get(db.TaskRun, task_run_id)
+    model = await session.get(
+        db.TaskRun, task_run_id, options=db.TaskRun.load_for_detail()
+    )
     return model
 
 
@@ -167,7 +169,11 @@ async def read_task_runs(
         List[db.TaskRun]: the task runs
     """
 
-    query = select(db.TaskRun).order_by(sort.as_sql_sort())
+    query = (
+        select(db.TaskRun)
+        .options(*db.TaskRun.load_for_list())
+        .order_by(sort.as_sql_sort())
+    )
 
     query = await _apply_task_run_filters(
         query,
@@ -240,6 +246,13 @@ async def delete_task_run(
         bool: whether or not the task run was deleted
     """
 
+    # there is no database-level foreign key from flow_run.parent_task_run_id,
+    # so null out any subflow references before deleting the task run
+    await session.execute(
+        sa.update(db.FlowRun)
+        .where(db.FlowRun.parent_task_run_id == task_run_id)
+        .values(parent_task_run_id=None)
+    )
     result = await session.execute(
         delete(db.TaskRun).where(db.TaskRun.id == task_run_id)
     )
@@ -57,13 +57,15 @@ class GlobalTaskPolicy(BaseOrchestrationPolicy):
 
 class SetRunStateType(BaseUniversalTransform):
     """
-    Updates the state type of a run on a state transition.
+    Updates the denormalized state columns of a run on a state transition.
     """
 
     async def before_transition(self, context: OrchestrationContext) -> None:
 
-        # record the new state's type
+        # record the new state's type, name, and timestamp
         context.run.state_type = context.proposed_state.type
+        context.run.state_name = context.proposed_state.name
+        context.run.state_timestamp = context.proposed_state.timestamp
 
 
 class SetStartTime(BaseUniversalTransform):
@@ -29,11 +29,15 @@ class StateType(AutoEnum):
     CANCELLED = AutoEnum.auto()
 
 
-TERMINAL_STATES = {
-    StateType.COMPLETED,
-    StateType.CANCELLED,
-    StateType.FAILED,
-}
+# frozen so membership tests stay O(1) and the collection is safely shareable
+# as a constant (e.g. embedded in cached SQL expressions)
+TERMINAL_STATES = frozenset(
+    {
+        StateType.COMPLETED,
+        StateType.CANCELLED,
+        StateType.FAILED,
+    }
+)
 
 
 class StateDetails(PrefectBaseModel):
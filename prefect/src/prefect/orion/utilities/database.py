@@ -7,10 +7,13 @@ allow Orion to seamlessly switch between the two.
 
 import datetime
 import json
+import os
 import re
+import time
 import uuid
 from typing import List
 
+import orjson
 import pendulum
 import pydantic
 import sqlalchemy as sa
@@ -25,6 +28,57 @@ from prefect import settings
 camel_to_snake = re.compile(r"(?<!^)(?=[A-Z])")
 
 
+def utcnow() -> datetime.datetime:
+    """
+    The current UTC time as a timezone-aware stdlib datetime.
+
+    Used for client-side column defaults: rows are created in tight loops
+    (log ingest, state transitions) and stdlib `datetime.now` is much cheaper
+    than pendulum's timezone machinery. Values are read back through the
+    `Timestamp` decorator, so downstream code still sees pendulum instances.
+    """
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7: a 48-bit unix-millisecond timestamp
+    followed by random bits, with standard version and variant markers.
+
+    Because ids generated in sequence sort together, primary key inserts land
+    at the hot end of the B-tree instead of at random positions, avoiding the
+    page splits that random UUIDv4 keys cause on the run and log tables.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    uuid_int = (unix_ms & 0xFFFFFFFFFFFF) << 80
+    uuid_int |= int.from_bytes(os.urandom(10), "big")
+    # set the version (7) and IETF variant bits
+    uuid_int &= ~(0xF << 76) & ~(0x3 << 62) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+    uuid_int |= (0x7 << 76) | (0x2 << 62)
+    return uuid.UUID(int=uuid_int)
+
+
+def json_serializer(value) -> str:
+    """
+    Serialize JSON column values with orjson, which is several times faster
+    than the stdlib encoder. Falls back to the pydantic encoder for types
+    orjson doesn't handle natively; non-string keys are coerced to strings to
+    match stdlib behavior.
+    """
+    return orjson.dumps(
+        value,
+        default=pydantic.json.pydantic_encoder,
+        option=orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+def json_deserializer(value):
+    """
+    Deserialize JSON column values with orjson.
+    """
+    return orjson.loads(value)
+
+
 class GenerateUUID(FunctionElement):
     """
     Platform-independent UUID default generator.
@@ -208,7 +262,13 @@ class Pydantic(TypeDecorator):
         # collection of JSON-compatible objects. we achieve that by dumping the
         # value to a json string using the pydantic JSON encoder and re-parsing
         # it into a python-native form.
-        return json.loads(json.dumps(value, default=pydantic.json.pydantic_encoder))
+        return orjson.loads(
+            orjson.dumps(
+                value,
+                default=pydantic.json.pydantic_encoder,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+        )
 
     def process_result_value(self, value, dialect):
         if value is not None:
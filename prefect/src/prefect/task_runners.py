@@ -50,12 +50,16 @@ The following task runners are currently supported:
 - `DaskTaskRunner`: creates a `LocalCluster` that task runs are submitted to; allows for parallelism with a flow run
 """
 import abc
+import asyncio
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Optional,
+    Sequence,
     TypeVar,
     Awaitable,
     AsyncIterator,
@@ -70,6 +74,7 @@ if TYPE_CHECKING:
 else:
     distributed = None
 
+from prefect.events import InProcessBus
 from prefect.futures import PrefectFuture
 from prefect.orion.schemas.states import State
 from prefect.orion.schemas.core import TaskRun
@@ -82,10 +87,23 @@ T = TypeVar("T", bound="BaseTaskRunner")
 R = TypeVar("R")
 
 
+@lru_cache(maxsize=None)
+def _import_cluster_class(name: str) -> Callable:
+    """
+    Resolve a cluster class path to the class once per process; constructing
+    runners with the same path — common in tests and on dask workers — repeats
+    the same module and attribute lookups otherwise
+    """
+    return import_object(name)
+
+
 class BaseTaskRunner(metaclass=abc.ABCMeta):
     def __init__(self) -> None:
         self.logger = get_logger(f"task_runner.{self.name}")
         self._started: bool = False
+        # Completion notifications for futures are published here, one message
+        # per task run id, when the final state is available
+        self._bus: Optional[InProcessBus] = InProcessBus()
 
     @property
     def name(self):
@@ -113,6 +131,33 @@ class BaseTaskRunner(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    async def submit_many(
+        self,
+        task_runs: Sequence[TaskRun],
+        run_fn: Callable[..., Awaitable[State[R]]],
+        run_kwargs_list: Sequence[Dict[str, Any]],
+        asynchronous: A = True,
+    ) -> List[PrefectFuture[R, A]]:
+        """
+        Submit a batch of calls for execution and return a `PrefectFuture` per call.
+
+        By default each call is submitted individually; task runners backed by an
+        external scheduler should override this to send the batch in a single
+        message and avoid a round-trip per task.
+
+        Args:
+            task_runs: The task runs being submitted, one per call
+            run_fn: The function to be executed for every call
+            run_kwargs_list: A dict of keyword arguments for each call to `run_fn`
+
+        Returns:
+            A list of futures in the same order as `task_runs`
+        """
+        return [
+            await self.submit(task_run, run_fn, run_kwargs, asynchronous=asynchronous)
+            for task_run, run_kwargs in zip(task_runs, run_kwargs_list)
+        ]
+
     @abc.abstractmethod
     async def wait(
         self, prefect_future: PrefectFuture, timeout: float = None
@@ -188,9 +233,14 @@ class SequentialTaskRunner(BaseTaskRunner):
         # Run the function immediately and store the result in memory
         self._results[task_run.id] = await run_fn(**run_kwargs)
 
-        return PrefectFuture(
+        future = PrefectFuture(
             task_run=task_run, task_runner=self, asynchronous=asynchronous
         )
+        # The result is stored; memoize it on the future and publish completion so
+        # waiters — including synchronous callers — never block or enter a portal
+        future._final_state = self._results[task_run.id]
+        self._bus.publish(task_run.id, self._results[task_run.id])
+        return future
 
     async def wait(
         self, prefect_future: PrefectFuture, timeout: float = None
@@ -198,6 +248,16 @@ class SequentialTaskRunner(BaseTaskRunner):
         return self._results[prefect_future.run_id]
 
 
+async def _run_task_from_kwargs(
+    run_fn: Callable[..., Awaitable[State[R]]], run_kwargs: Dict[str, Any]
+) -> State[R]:
+    """
+    Adapter for batched dask submission; `Client.map` can only pass positional
+    arguments to the mapped function
+    """
+    return await run_fn(**run_kwargs)
+
+
 class DaskTaskRunner(BaseTaskRunner):
     """
     A parallel task_runner that submits tasks to the `dask.distributed` scheduler.
@@ -270,9 +330,7 @@ class DaskTaskRunner(BaseTaskRunner):
                 )
         else:
             if isinstance(cluster_class, str):
-                cluster_class = import_object(cluster_class)
-            else:
-                cluster_class = cluster_class
+                cluster_class = _import_cluster_class(cluster_class)
 
         # Create a copies of incoming kwargs since we may mutate them
         cluster_kwargs = cluster_kwargs.copy() if cluster_kwargs else {}
@@ -320,11 +378,64 @@ class DaskTaskRunner(BaseTaskRunner):
                 "The task runner must be started before submitting work."
             )
 
-        self._dask_futures[task_run.id] = self._client.submit(run_fn, **run_kwargs)
+        dask_future = self._dask_futures[task_run.id] = self._client.submit(
+            run_fn, **run_kwargs
+        )
 
-        return PrefectFuture(
+        future = PrefectFuture(
             task_run=task_run, task_runner=self, asynchronous=asynchronous
         )
+        # Publish completion when the dask future finishes; the state itself is
+        # retrieved in `wait` since it is not available synchronously here.
+        # `call_soon_threadsafe` is required since dask may run the callback from
+        # another thread while the bus is not thread-safe.
+        bus = self._bus
+        loop = asyncio.get_running_loop()
+        dask_future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(bus.publish, task_run.id, None)
+        )
+        return future
+
+    async def submit_many(
+        self,
+        task_runs: Sequence[TaskRun],
+        run_fn: Callable[..., Awaitable[State[R]]],
+        run_kwargs_list: Sequence[Dict[str, Any]],
+        asynchronous: A = True,
+    ) -> List[PrefectFuture[R, A]]:
+        """
+        Submit a batch of calls to the dask scheduler in a single `Client.map`
+        message instead of one round-trip per task
+        """
+        if not self._started:
+            raise RuntimeError(
+                "The task runner must be started before submitting work."
+            )
+
+        # Task run ids are used as keys so identical calls are not deduplicated
+        dask_futures = self._client.map(
+            _run_task_from_kwargs,
+            [run_fn] * len(task_runs),
+            run_kwargs_list,
+            key=[str(task_run.id) for task_run in task_runs],
+        )
+
+        bus = self._bus
+        loop = asyncio.get_running_loop()
+        futures = []
+        for task_run, dask_future in zip(task_runs, dask_futures):
+            self._dask_futures[task_run.id] = dask_future
+            futures.append(
+                PrefectFuture(
+                    task_run=task_run, task_runner=self, asynchronous=asynchronous
+                )
+            )
+            dask_future.add_done_callback(
+                lambda _, task_run_id=task_run.id: loop.call_soon_threadsafe(
+                    bus.publish, task_run_id, None
+                )
+            )
+        return futures
 
     def _get_dask_future(self, prefect_future: PrefectFuture) -> "distributed.Future":
         """
@@ -419,7 +530,9 @@ class DaskTaskRunner(BaseTaskRunner):
         which contains locks. Must be deserialized on a dask worker.
         """
         data = self.__dict__.copy()
-        data.update({k: None for k in {"_client", "_cluster"}})
+        # The bus holds loop-bound waiters and is only meaningful in the
+        # submitting process; futures on workers wait in the task runner instead
+        data.update({k: None for k in {"_client", "_cluster", "_bus"}})
         return data
 
     def __setstate__(self, data: dict):
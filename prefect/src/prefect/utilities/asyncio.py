@@ -1,7 +1,10 @@
 """
 Utilities for interoperability with async functions and workers from various contexts.
 """
+import asyncio
+import concurrent.futures
 import inspect
+import threading
 import warnings
 from contextvars import copy_context
 from functools import partial, wraps
@@ -11,7 +14,6 @@ from contextlib import asynccontextmanager
 from uuid import uuid4
 
 import anyio
-import sniffio
 from typing_extensions import ParamSpec, TypeGuard
 
 T = TypeVar("T")
@@ -21,7 +23,10 @@ Async = Literal[True]
 Sync = Literal[False]
 A = TypeVar("A", Async, Sync, covariant=True)
 
-# Global references to prevent garbage collection for `add_event_loop_shutdown_callback`
+# Global references to prevent garbage collection for
+# `add_event_loop_shutdown_callback`, grouped by the owning event loop as
+# `loop id -> (loop, {callback id -> generator})` so all of a loop's
+# references can be dropped together
 EVENT_LOOP_GC_REFS = {}
 
 
@@ -37,6 +42,12 @@ def is_async_fn(
     return inspect.iscoroutinefunction(func)
 
 
+# The event loop that spawned the current worker thread, set for the duration
+# of calls made by `run_sync_in_worker_thread` so `run_async_from_worker_thread`
+# can submit work to it directly
+_worker_thread_loop = threading.local()
+
+
 async def run_sync_in_worker_thread(
     __fn: Callable[..., T], *args: Any, **kwargs: Any
 ) -> T:
@@ -49,7 +60,33 @@ async def run_sync_in_worker_thread(
     """
     call = partial(__fn, *args, **kwargs)
     context = copy_context()  # Pass the context to the worker thread
-    return await anyio.to_thread.run_sync(context.run, call, cancellable=True)
+    # An empty snapshot has no variables to transfer; skip the context
+    # push/pop around the call. The copy itself is O(1) structural sharing.
+    run = partial(context.run, call) if len(context) else call
+    loop = asyncio.get_running_loop()
+
+    def run_in_thread():
+        _worker_thread_loop.value = loop
+        try:
+            return run()
+        finally:
+            _worker_thread_loop.value = None
+
+    return await anyio.to_thread.run_sync(run_in_thread, cancellable=True)
+
+
+def _run_on_loop(call: Callable[[], Awaitable], future: "concurrent.futures.Future"):
+    task = asyncio.ensure_future(call())
+
+    def copy_result(task):
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    task.add_done_callback(copy_result)
 
 
 def run_async_from_worker_thread(
@@ -60,7 +97,16 @@ def run_async_from_worker_thread(
     thread until completion
     """
     call = partial(__fn, *args, **kwargs)
-    return anyio.from_thread.run(call)
+    loop = getattr(_worker_thread_loop, "value", None)
+    if loop is None:
+        # Not a worker thread we spawned; use anyio's portal machinery
+        return anyio.from_thread.run(call)
+    # Ship the coroutine straight to the loop that spawned this worker and
+    # block on a plain future, skipping anyio's portal lookup and token
+    # handling on every call
+    future = concurrent.futures.Future()
+    loop.call_soon_threadsafe(_run_on_loop, call, future)
+    return future.result()
 
 
 def run_async_in_new_loop(__fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any):
@@ -68,18 +114,16 @@ def run_async_in_new_loop(__fn: Callable[..., Awaitable[T]], *args: Any, **kwarg
 
 
 def in_async_worker_thread() -> bool:
-    try:
-        anyio.from_thread.threadlocals.current_async_module
-    except AttributeError:
-        return False
-    else:
-        return True
+    # `getattr` with a default avoids raising and catching an `AttributeError`,
+    # which is an order of magnitude slower than a failed attribute lookup
+    return (
+        getattr(anyio.from_thread.threadlocals, "current_async_module", None)
+        is not None
+    )
 
 
 def in_async_main_thread() -> bool:
-    try:
-        sniffio.current_async_library()
-    except sniffio.AsyncLibraryNotFoundError:
+    if asyncio._get_running_loop() is None:
         return False
     else:
         # We could be in a worker thread, not the main thread
@@ -105,9 +149,18 @@ def sync_compatible(async_fn: T) -> T:
     if not inspect.iscoroutinefunction(async_fn):
         raise TypeError("The decorated function must be async.")
 
+    # The dispatch cannot be specialized per function: the same decorated
+    # function is routinely called from async and sync contexts within one
+    # process, so the context must be checked on every call. The accessor is
+    # pre-bound as a keyword-only default so the hot async path pays a local
+    # load instead of attribute lookups.
     @wraps(async_fn)
-    def wrapper(*args, **kwargs):
-        if in_async_main_thread():
+    def wrapper(*args, _get_running_loop=asyncio._get_running_loop, **kwargs):
+        # Decorated functions are called on hot paths, so dispatch is decided
+        # with the C-level running-loop accessor — a worker thread never has a
+        # loop running in it, so a running loop means we are in an async
+        # context and can hand back the coroutine directly
+        if _get_running_loop() is not None:
             # In the main async context; return the coro for them to await
             return async_fn(*args, **kwargs)
         elif in_async_worker_thread():
@@ -173,16 +226,39 @@ async def add_event_loop_shutdown_callback(coroutine_fn: Callable[[], Awaitable]
             yield
         except GeneratorExit:
             await coroutine_fn()
-            # Remove self from the garbage collection set
-            EVENT_LOOP_GC_REFS.pop(key)
+            # Remove self from the garbage collection set; drop the loop's
+            # group once its last callback has run
+            loop_refs.pop(key, None)
+            if not loop_refs:
+                EVENT_LOOP_GC_REFS.pop(loop_id, None)
 
     # Create the iterator and store it in a global variable so it is not garbage
     # collected. If the iterator is garbage collected before the event loop closes, the
     # callback will not run. Since this function does not know the scope of the event
     # loop that is calling it, a reference with global scope is necessary to ensure
     # garbage collection does not occur until after event loop closure.
+    loop = asyncio.get_running_loop()
+
+    # If a loop is closed without finalizing its async generators, its
+    # callbacks can never run and the retained generators would otherwise
+    # persist — and keep their loops alive — for the life of the process.
+    # Sweep those groups here so orphans do not accumulate across many
+    # short-lived loops.
+    for stale_id in [
+        group_id
+        for group_id, (group_loop, _) in EVENT_LOOP_GC_REFS.items()
+        if group_loop.is_closed()
+    ]:
+        EVENT_LOOP_GC_REFS.pop(stale_id)
+
+    loop_id = id(loop)
+    entry = EVENT_LOOP_GC_REFS.get(loop_id)
+    if entry is None:
+        entry = EVENT_LOOP_GC_REFS[loop_id] = (loop, {})
+    loop_refs = entry[1]
+
     key = id(on_shutdown)
-    EVENT_LOOP_GC_REFS[key] = on_shutdown(key)
+    loop_refs[key] = on_shutdown(key)
 
     # Begin iterating so it will be cleaned up as an incomplete generator
-    await EVENT_LOOP_GC_REFS[key].__anext__()
+    await loop_refs[key].__anext__()
@@ -1,12 +1,13 @@
 """
 Utilities for complex operations on Python collections
 """
+import asyncio
 import itertools
 from collections import OrderedDict, defaultdict
 from collections.abc import Iterator as IteratorABC
 from collections.abc import Sequence, Set
 from dataclasses import dataclass, fields, is_dataclass
-from functools import partial
+from functools import lru_cache, partial
 from typing import (
     Any,
     Awaitable,
@@ -26,12 +27,16 @@ from unittest.mock import Mock
 
 import pydantic
 import prefect
+from prefect.utilities.asyncio import is_async_fn
 
 
 T = TypeVar("T")
 KT = TypeVar("KT")
 VT = TypeVar("VT")
 
+# `itertools.batched` (Python 3.12+) batches entirely in C
+_batched = getattr(itertools, "batched", None)
+
 
 def dict_to_flatdict(
     dct: Dict[KT, Union[Any, Dict[KT, Any]]], _parent: Tuple[KT, ...] = None
@@ -52,12 +57,25 @@ def dict_to_flatdict(
     items: List[Tuple[Tuple[KT, ...], Any]] = []
     parent = _parent or tuple()
 
-    for k, v in dct.items():
-        k_parent = tuple(parent + (k,))
+    # Traverse with an explicit stack of iterators instead of recursing so
+    # that deeply nested dictionaries do not pay a Python function call per
+    # level; the shared `path` list grows and shrinks with the descent and is
+    # only snapshotted into a tuple when a leaf is emitted
+    stack: List[Iterator[Tuple[KT, Any]]] = [iter(dct.items())]
+    path: List[KT] = list(parent)
+    while stack:
+        try:
+            k, v = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            if stack:
+                path.pop()
+            continue
         if isinstance(v, dict):
-            items.extend(dict_to_flatdict(v, _parent=k_parent).items())
+            stack.append(iter(v.items()))
+            path.append(k)
         else:
-            items.append((k_parent, v))
+            items.append(((*path, k), v))
     return typ(items)
 
 
@@ -75,14 +93,31 @@ def flatdict_to_dict(
     """
     typ = type(dct)
     result = cast(Dict[KT, Union[VT, Dict[KT, VT]]], typ())
+
+    # Flat dicts produced by `dict_to_flatdict` group keys sharing a prefix
+    # together, so remember the chain of nested dicts along the previous key
+    # and only `setdefault` below the longest common prefix; `path[i]` holds
+    # the dict reached by the first `i` keys of `prev_prefix`
+    prev_prefix: Tuple[KT, ...] = tuple()
+    path: List[Dict[KT, Any]] = [result]
+
     for key_tuple, value in dct.items():
-        current_dict = result
-        for prefix_key in key_tuple[:-1]:
+        prefix = key_tuple[:-1]
+        common = 0
+        max_common = min(len(prefix), len(path) - 1)
+        while common < max_common and prefix[common] == prev_prefix[common]:
+            common += 1
+        del path[common + 1 :]
+
+        current_dict = path[common]
+        for prefix_key in prefix[common:]:
             # Build nested dictionaries up for the current key tuple
             # Use `setdefault` in case the nested dict has already been created
             current_dict = current_dict.setdefault(prefix_key, typ())  # type: ignore
+            path.append(current_dict)
         # Set the value
         current_dict[key_tuple[-1]] = value
+        prev_prefix = prefix
 
     return result
 
@@ -90,7 +125,16 @@ def flatdict_to_dict(
 T = TypeVar("T")
 
 
+# Concrete types that the ABC checks in `ensure_iterable` would accept;
+# checking these directly skips the `__subclasshook__` resolution that makes
+# `isinstance` against `Sequence` and `Set` expensive. `dict` is deliberately
+# absent — mappings are wrapped, not returned as-is.
+_ITERABLE_CONCRETE = frozenset({list, tuple, set, frozenset, str})
+
+
 def ensure_iterable(obj: Union[T, Iterable[T]]) -> Iterable[T]:
+    if type(obj) in _ITERABLE_CONCRETE:
+        return obj
     if isinstance(obj, Sequence) or isinstance(obj, Set):
         return obj
     obj = cast(T, obj)  # No longer in the iterable case
@@ -98,7 +142,9 @@ def ensure_iterable(obj: Union[T, Iterable[T]]) -> Iterable[T]:
 
 
 def listrepr(objs: Iterable, sep=" ") -> str:
-    return sep.join(repr(obj) for obj in objs)
+    # str.join materializes non-sequence arguments into a list anyway; a list
+    # comprehension hands it one directly
+    return sep.join([repr(obj) for obj in objs])
 
 
 def extract_instances(
@@ -116,20 +162,24 @@ def extract_instances(
         If a single type is given: a list of instances of that type
         If a tuple of types is given: a mapping of type to a list of instances
     """
-    types = ensure_iterable(types)
+    types = tuple(ensure_iterable(types))
+
+    if len(types) == 1:
+        return [o for o in objects if isinstance(o, types[0])]
 
     # Create a mapping of type -> instance from the exec values
     ret = defaultdict(list)
 
     for o in objects:
+        # A single isinstance check against the tuple rejects non-matching
+        # objects before the per-type loop below
+        if not isinstance(o, types):
+            continue
         # We iterate here so that the key is the passed type rather than type(o)
         for type_ in types:
             if isinstance(o, type_):
                 ret[type_].append(o)
 
-    if len(types) == 1:
-        return ret[types[0]]
-
     return ret
 
 
@@ -144,12 +194,15 @@ def batched_iterable(iterable: Iterable[T], size: int) -> Iterator[Tuple[T, ...]
     Yields:
         tuple: A batch of the iterable
     """
-    it = iter(iterable)
-    while True:
-        batch = tuple(itertools.islice(it, size))
-        if not batch:
-            break
-        yield batch
+    if _batched is not None:
+        yield from _batched(iterable, size)
+    else:
+        it = iter(iterable)
+        while True:
+            batch = tuple(itertools.islice(it, size))
+            if not batch:
+                break
+            yield batch
 
 
 @dataclass
@@ -179,6 +232,102 @@ def quote(expr: T) -> Quote[T]:
     return Quote(expr)
 
 
+# Field names are a property of the class; `dataclasses.fields` rebuilds a
+# tuple of field objects on every call and `__fields__` lookups pay for
+# attribute resolution, so both are memoized per class
+@lru_cache(maxsize=None)
+def _dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _pydantic_field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(cls.__fields__)
+
+
+# Leaf types that can never be collections; in a realistic tree most visited
+# nodes are leaves, so one membership test up front replaces the full chain of
+# isinstance and dispatch checks for them
+_PRIMITIVES = frozenset({int, str, float, bool, type(None), bytes, bytearray})
+
+
+def _visit_collection_sync(expr, visit_fn: Callable[[Any], Any]) -> None:
+    """
+    Synchronous traversal used by `visit_collection` when the visitor is a
+    plain function and no data needs to be returned; visits the same elements
+    without creating and awaiting a coroutine per element.
+    """
+    if type(expr) in _PRIMITIVES:
+        visit_fn(expr)
+        return
+
+    # Get the expression type; treat iterators like lists
+    typ = list if isinstance(expr, IteratorABC) else type(expr)
+
+    # do not visit mock objects
+    if isinstance(expr, Mock):
+        return
+
+    elif typ in (list, tuple, set):
+        for o in expr:
+            _visit_collection_sync(o, visit_fn)
+
+    elif typ in (dict, OrderedDict):
+        for k, v in expr.items():
+            _visit_collection_sync(k, visit_fn)
+            _visit_collection_sync(v, visit_fn)
+
+    elif is_dataclass(expr) and not isinstance(expr, type):
+        for name in _dataclass_field_names(typ):
+            _visit_collection_sync(getattr(expr, name), visit_fn)
+
+    elif (
+        # Recurse into Pydantic models but do _not_ do so for states/datadocs
+        isinstance(expr, pydantic.BaseModel)
+        and not isinstance(expr, prefect.orion.schemas.states.State)
+        and not isinstance(expr, prefect.orion.schemas.data.DataDocument)
+    ):
+        for name in _pydantic_field_names(typ):
+            _visit_collection_sync(getattr(expr, name), visit_fn)
+
+    else:
+        visit_fn(expr)
+
+
+async def _visit_seq(expr, typ, recurse, return_data):
+    # Visit elements concurrently; awaiting one at a time would serialize any
+    # I/O performed by the visitor. Single-element containers skip the
+    # scheduling overhead of `gather`.
+    coros = [recurse(o) for o in expr]
+    if len(coros) > 1:
+        result = await asyncio.gather(*coros)
+    else:
+        result = [await coro for coro in coros]
+    return typ(result) if return_data else None
+
+
+async def _visit_map(expr, typ, recurse, return_data):
+    if len(expr) > 1:
+        flat = await asyncio.gather(
+            *[recurse(x) for item in expr.items() for x in item]
+        )
+        result = list(zip(flat[::2], flat[1::2]))
+    else:
+        result = [[await recurse(k), await recurse(v)] for k, v in expr.items()]
+    return typ(result) if return_data else None
+
+
+# Exact-type dispatch table for the builtin collections handled by
+# `visit_collection`; a single dict lookup replaces chained membership tests
+_VISIT_DISPATCH = {
+    list: _visit_seq,
+    tuple: _visit_seq,
+    set: _visit_seq,
+    dict: _visit_map,
+    OrderedDict: _visit_map,
+}
+
+
 async def visit_collection(
     expr, visit_fn: Callable[[Any], Awaitable[Any]], return_data: bool = False
 ):
@@ -191,11 +340,22 @@ async def visit_collection(
     Args:
         expr (Any): a Python object or expression
         visit_fn (Callable[[Any], Awaitable[Any]]): an async function that
-            will be applied to every non-collection element of expr.
+            will be applied to every non-collection element of expr. A plain
+            function may be passed instead when `return_data=False`.
         return_data (bool): if `True`, a copy of `expr` containing data modified
             by `visit_fn` will be returned. This is slower than `return_data=False`
             (the default).
     """
+    # Check the visitor once up front instead of per element; a synchronous
+    # visitor with no data to return can skip coroutine creation entirely
+    if not return_data and not is_async_fn(visit_fn):
+        return _visit_collection_sync(expr, visit_fn)
+
+    # Send primitive leaves straight to the visitor
+    if type(expr) in _PRIMITIVES:
+        result = await visit_fn(expr)
+        return result if return_data else None
+
     # package the provided arguments for recursive calls
     recurse = partial(visit_collection, visit_fn=visit_fn, return_data=return_data)
 
@@ -207,17 +367,15 @@ async def visit_collection(
     if isinstance(expr, Mock):
         return expr if return_data else None
 
-    elif typ in (list, tuple, set):
-        result = [await recurse(o) for o in expr]
-        return typ(result) if return_data else None
-
-    elif typ in (dict, OrderedDict):
-        assert isinstance(expr, (dict, OrderedDict))  # typecheck assertion
-        result = [[await recurse(k), await recurse(v)] for k, v in expr.items()]
-        return typ(result) if return_data else None
+    visit = _VISIT_DISPATCH.get(typ)
+    if visit is not None:
+        return await visit(expr, typ, recurse, return_data)
 
     elif is_dataclass(expr) and not isinstance(expr, type):
-        result = {f.name: await recurse(getattr(expr, f.name)) for f in fields(expr)}
+        result = {
+            name: await recurse(getattr(expr, name))
+            for name in _dataclass_field_names(typ)
+        }
         return typ(**result) if return_data else None
 
     elif (
@@ -226,7 +384,10 @@ async def visit_collection(
         and not isinstance(expr, prefect.orion.schemas.states.State)
         and not isinstance(expr, prefect.orion.schemas.data.DataDocument)
     ):
-        result = {f: await recurse(getattr(expr, f)) for f in expr.__fields__}
+        result = {
+            name: await recurse(getattr(expr, name))
+            for name in _pydantic_field_names(typ)
+        }
         return typ(**result) if return_data else None
 
     else:
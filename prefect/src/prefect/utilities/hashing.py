@@ -1,5 +1,7 @@
 import hashlib
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -27,17 +29,27 @@ def stable_hash(*args: Union[str, bytes, int]) -> str:
     return h.hexdigest()
 
 
+@lru_cache(maxsize=1024)
+def _file_hash(path: str, mtime_ns: int, size: int) -> str:
+    contents = Path(path).read_bytes()
+    return stable_hash(contents)
+
+
 def file_hash(path: str) -> str:
     """Given a path to a file, produces a stable hash of the file contents.
 
+    The hash is memoized by path, modification time, and size so repeated
+    calls for an unchanged file — every flow decoration in a module triggers
+    one — cost a `stat` instead of re-reading and re-hashing the contents.
+
     Args:
         path (str): the path to a file
 
     Returns:
         str: a hash of the file contents
     """
-    contents = Path(path).read_bytes()
-    return stable_hash(contents)
+    stat = os.stat(path)
+    return _file_hash(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def to_qualified_name(obj: Any) -> str:
@@ -408,6 +408,14 @@ class Settings(SharedSettings):
         Defaults to `None`.""",
     )
 
+    resolve_concurrency: int = Field(
+        512,
+        description="""The maximum number of futures that will be waited on
+        concurrently when resolving futures in collections. Bounds the number of
+        pending waiters on the event loop for flows with very large numbers of
+        task runs. Defaults to `512`.""",
+    )
+
 
 settings = Settings()
 
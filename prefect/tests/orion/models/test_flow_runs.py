@@ -1037,6 +1037,57 @@ class TestReadFlowRuns:
         assert result[0].id == flow_run_2.id
 
 
+class TestFlowRunListStmt:
+    async def test_list_stmt_filters_by_flow_and_state_type(self, flow, session):
+        for _ in range(3):
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id, state=schemas.states.Completed()
+                ),
+            )
+        result = await session.execute(
+            models.flow_runs.flow_run_list_stmt(),
+            dict(
+                flow_id=flow.id,
+                state_types=[schemas.states.StateType.COMPLETED],
+                limit=10,
+                offset=0,
+            ),
+        )
+        assert len(result.scalars().unique().all()) == 3
+
+        result = await session.execute(
+            models.flow_runs.flow_run_list_stmt(),
+            dict(
+                flow_id=flow.id,
+                state_types=[schemas.states.StateType.FAILED],
+                limit=10,
+                offset=0,
+            ),
+        )
+        assert result.scalars().unique().all() == []
+
+    async def test_list_stmt_applies_limit_and_offset(self, flow, session):
+        for _ in range(3):
+            await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id, state=schemas.states.Completed()
+                ),
+            )
+        result = await session.execute(
+            models.flow_runs.flow_run_list_stmt(),
+            dict(
+                flow_id=flow.id,
+                state_types=[schemas.states.StateType.COMPLETED],
+                limit=2,
+                offset=2,
+            ),
+        )
+        assert len(result.scalars().unique().all()) == 1
+
+
 class TestReadFlowRunTaskRunDependencies:
     async def test_read_task_run_dependencies(self, flow_run, session):
         task_run_1 = await models.task_runs.create_task_run(
@@ -1112,6 +1163,39 @@ class TestDeleteFlowRun:
         )
         assert result is None
 
+    async def test_delete_flow_run_clears_subflow_parent_references(
+        self, flow, session
+    ):
+        # create a flow run with a task run and a subflow run that refers to it
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(flow_id=flow.id),
+        )
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id, task_key="my-key", dynamic_key="0"
+            ),
+        )
+        subflow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id, parent_task_run_id=task_run.id
+            ),
+        )
+
+        assert await models.flow_runs.delete_flow_run(
+            session=session, flow_run_id=flow_run.id
+        )
+
+        # there is no database-level foreign key from parent_task_run_id, so
+        # the subflow run's reference must be cleared rather than left dangling
+        result = await models.flow_runs.read_flow_run(
+            session=session, flow_run_id=subflow_run.id
+        )
+        assert result is not None
+        assert result.parent_task_run_id is None
+
     async def test_delete_flow_run_returns_false_if_does_not_exist(self, session):
         result = await models.flow_runs.delete_flow_run(
             session=session, flow_run_id=uuid4()
@@ -291,6 +291,42 @@ class TestDeleteFlow:
         # make sure the flow is deleted
         assert (await models.flows.read_flow(session=session, flow_id=flow.id)) is None
 
+    async def test_delete_flow_clears_subflow_parent_references(self, session):
+        # create a flow with a run, a task run, and a subflow run of another
+        # flow that refers to that task run
+        flow = await models.flows.create_flow(
+            session=session, flow=schemas.core.Flow(name="my-flow")
+        )
+        other_flow = await models.flows.create_flow(
+            session=session, flow=schemas.core.Flow(name="my-other-flow")
+        )
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(flow_id=flow.id),
+        )
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id, task_key="my-key", dynamic_key="0"
+            ),
+        )
+        subflow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=other_flow.id, parent_task_run_id=task_run.id
+            ),
+        )
+
+        assert await models.flows.delete_flow(session=session, flow_id=flow.id)
+
+        # there is no database-level foreign key from parent_task_run_id, so
+        # the subflow run's reference must be cleared rather than left dangling
+        result = await models.flow_runs.read_flow_run(
+            session=session, flow_run_id=subflow_run.id
+        )
+        assert result is not None
+        assert result.parent_task_run_id is None
+
     async def test_delete_flow_returns_false_if_does_not_exist(self, session):
         result = await models.flows.delete_flow(session=session, flow_id=str(uuid4()))
         assert result is False
@@ -1,5 +1,8 @@
+import asyncio
 import enum
+import os
 import time
+from functools import lru_cache
 from typing import List
 
 import anyio
@@ -7,11 +10,11 @@ import pydantic
 import pytest
 
 from prefect import flow, tags, task, get_run_logger
-from prefect.client import OrionClient
 from prefect.engine import raise_failed_state
 from prefect.exceptions import ParameterTypeError
 from prefect.flows import Flow
 from prefect.orion.schemas.core import TaskRunResult
+from prefect.orion.schemas.filters import LogFilter
 from prefect.orion.schemas.data import DataDocument
 from prefect.orion.schemas.states import State, StateType
 from prefect.utilities.hashing import file_hash
@@ -97,7 +100,7 @@ class TestDecorator:
 
 
 class TestFlowCall:
-    async def test_call_creates_flow_run_and_runs(self):
+    async def test_call_creates_flow_run_and_runs(self, orion_client):
         @flow(version="test")
         def foo(x, y=3, z=3):
             return x + y + z
@@ -107,13 +110,12 @@ class TestFlowCall:
         assert state.result() == 6
         assert state.state_details.flow_run_id is not None
 
-        async with OrionClient() as client:
-            flow_run = await client.read_flow_run(state.state_details.flow_run_id)
+        flow_run = await orion_client.read_flow_run(state.state_details.flow_run_id)
         assert flow_run.id == state.state_details.flow_run_id
         assert flow_run.parameters == {"x": 1, "y": 2, "z": 3}
         assert flow_run.flow_version == foo.version
 
-    async def test_async_call_creates_flow_run_and_runs(self):
+    async def test_async_call_creates_flow_run_and_runs(self, orion_client):
         @flow(version="test")
         async def foo(x, y=3, z=3):
             return x + y + z
@@ -123,8 +125,7 @@ class TestFlowCall:
         assert state.result() == 6
         assert state.state_details.flow_run_id is not None
 
-        async with OrionClient() as client:
-            flow_run = await client.read_flow_run(state.state_details.flow_run_id)
+        flow_run = await orion_client.read_flow_run(state.state_details.flow_run_id)
         assert flow_run.id == state.state_details.flow_run_id
         assert flow_run.parameters == {"x": 1, "y": 2, "z": 3}
         assert flow_run.flow_version == foo.version
@@ -169,6 +170,19 @@ class TestFlowCall:
         ):
             raise state.result()
 
+    @pytest.mark.parametrize("parameters", [{}, {"bad": 1}])
+    def test_validate_parameters_rejects_bad_names_without_annotations(
+        self, parameters
+    ):
+        @flow(version="test")
+        def foo(x):
+            pass
+
+        # Deployment-supplied parameters bypass the call signature, so the
+        # validation gate must catch name errors even with no annotations
+        with pytest.raises(ParameterTypeError):
+            foo.validate_parameters(parameters)
+
     def test_call_ignores_incompatible_parameter_types_if_asked(self):
         @flow(version="test", validate_parameters=False)
         def foo(x: int):
@@ -349,91 +363,91 @@ class TestFlowCall:
             second.result()
 
 
-class TestSubflowRuns:
-    async def test_subflow_call_with_no_tasks(self):
-        @flow(version="foo")
-        def child(x, y, z):
-            return x + y + z
-
-        @flow(version="bar")
-        def parent(x, y=2, z=3):
-            subflow_state = child(x, y, z)
-            return subflow_state
+@lru_cache(maxsize=None)
+def subflow_matrix_flow(parent_async, child_async, task_async):
+    """
+    Build a parent flow calling a child flow calling a task, with each layer
+    sync or async per the flags. Cached so the matrix test pays decoration
+    cost (signature inspection, file hashing, parameter models) once per combo.
+    """
+    if task_async:
 
-        parent_state = parent(1, 2)
-        assert isinstance(parent_state, State)
+        @task
+        async def compute(x, y, z):
+            return x + y + z
 
-        child_state = parent_state.result()
-        assert child_state.result() == 6
+    else:
 
-    def test_subflow_call_with_returned_task(self):
         @task
         def compute(x, y, z):
             return x + y + z
 
+    if child_async:
+
+        @flow(version="foo")
+        async def child(x, y, z):
+            state = compute(x, y, z)
+            return (await state) if task_async else state
+
+    else:
+
         @flow(version="foo")
         def child(x, y, z):
             return compute(x, y, z)
 
-        @flow(version="bar")
-        def parent(x, y=2, z=3):
-            return child(x, y, z)
+    if parent_async:
 
-        parent_state = parent(1, 2)
-        assert isinstance(parent_state, State)
-        child_state = parent_state.result()
-        assert child_state.result().result() == 6
-
-    async def test_async_flow_with_async_subflow_and_async_task(self):
-        @task
-        async def compute_async(x, y, z):
-            return x + y + z
+        @flow(version="bar")
+        async def parent(x, y=2, z=3):
+            state = child(x, y, z)
+            return (await state) if child_async else state
 
-        @flow(version="foo")
-        async def child(x, y, z):
-            return await compute_async(x, y, z)
+    else:
 
         @flow(version="bar")
-        async def parent(x, y=2, z=3):
-            return await child(x, y, z)
+        def parent(x, y=2, z=3):
+            return child(x, y, z)
 
-        parent_state = await parent(1, 2)
-        assert isinstance(parent_state, State)
-        child_state = parent_state.result()
-        assert child_state.result().result() == 6
+    return parent
 
-    async def test_async_flow_with_async_subflow_and_sync_task(self):
-        @task
-        def compute(x, y, z):
-            return x + y + z
 
+class TestSubflowRuns:
+    async def test_subflow_call_with_no_tasks(self):
         @flow(version="foo")
-        async def child(x, y, z):
-            return compute(x, y, z)
+        def child(x, y, z):
+            return x + y + z
 
         @flow(version="bar")
-        async def parent(x, y=2, z=3):
-            return await child(x, y, z)
+        def parent(x, y=2, z=3):
+            subflow_state = child(x, y, z)
+            return subflow_state
 
-        parent_state = await parent(1, 2)
+        parent_state = parent(1, 2)
         assert isinstance(parent_state, State)
-        child_state = parent_state.result()
-        assert child_state.result().result() == 6
 
-    async def test_async_flow_with_sync_subflow_and_sync_task(self):
-        @task
-        def compute(x, y, z):
-            return x + y + z
-
-        @flow(version="foo")
-        def child(x, y, z):
-            return compute(x, y, z)
+        child_state = parent_state.result()
+        assert child_state.result() == 6
 
-        @flow(version="bar")
-        async def parent(x, y=2, z=3):
-            return child(x, y, z)
+    # A sync caller cannot await, so each layer must be at least as
+    # synchronous as the one it calls; the other four combinations of the
+    # matrix are not constructible
+    @pytest.mark.parametrize(
+        "parent_async,child_async,task_async",
+        [
+            (False, False, False),
+            (True, False, False),
+            (True, True, False),
+            (True, True, True),
+        ],
+    )
+    async def test_subflow_call_with_returned_task(
+        self, parent_async, child_async, task_async
+    ):
+        parent = subflow_matrix_flow(parent_async, child_async, task_async)
 
-        parent_state = await parent(1, 2)
+        parent_state = parent(1, 2)
+        if parent_async:
+            parent_state = await parent_state
         assert isinstance(parent_state, State)
         child_state = parent_state.result()
         assert child_state.result().result() == 6
@@ -453,7 +467,11 @@ class TestSubflowRuns:
         child_state = parent_state.result()
         child_flow_run_id = child_state.state_details.flow_run_id
 
-        child_flow_run = await orion_client.read_flow_run(child_flow_run_id)
+        # The run and state reads are independent; overlap the round-trips
+        child_flow_run, child_flow_run_states = await asyncio.gather(
+            orion_client.read_flow_run(child_flow_run_id),
+            orion_client.read_flow_run_states(child_flow_run_id),
+        )
 
         # This task represents the child flow run in the parent
         parent_flow_run_task = await orion_client.read_task_run(
@@ -470,7 +488,7 @@ class TestSubflowRuns:
 
         assert all(
             state.state_details.task_run_id == parent_flow_run_task.id
-            for state in await orion_client.read_flow_run_states(child_flow_run_id)
+            for state in child_flow_run_states
         ), "All server subflow run states link to the parent task"
 
         assert (
@@ -522,16 +540,46 @@ class TestFlowRunTags:
         assert set(flow_run.tags) == {"a", "b", "c", "d"}
 
 
+# How long timeout tests wait before asserting that a canary file was NOT
+# created. These waits cannot exit early, so they are kept short and can be
+# tuned for slow machines
+SETTLE_TIME = float(os.environ.get("PREFECT_SLOW_TEST_SETTLE", "0.5"))
+
+
+def wait_for_canary(path, timeout=2.0):
+    """
+    Poll for a canary file instead of sleeping a fixed interval so positive
+    assertions exit as soon as the file appears
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if path.exists():
+            return True
+        time.sleep(0.01)
+    return path.exists()
+
+
 class TestFlowTimeouts:
-    def test_flows_fail_with_timeout(self):
-        @flow(timeout_seconds=0.1)
+    # One parametrized test covers both sides of the timeout boundary with a
+    # single flow builder instead of a separate decorated flow per case
+    @pytest.mark.parametrize(
+        "flow_duration,timeout_seconds,expected_name",
+        [(0.1, 0.5, "Completed"), (1, 0.1, "TimedOut")],
+    )
+    def test_timeout_applies_only_if_exceeded(
+        self, flow_duration, timeout_seconds, expected_name
+    ):
+        @flow(timeout_seconds=timeout_seconds)
         def my_flow():
-            time.sleep(1)
+            time.sleep(flow_duration)
 
         state = my_flow()
-        assert state.is_failed()
-        assert state.name == "TimedOut"
-        assert "exceeded timeout of 0.1 seconds" in state.message
+        assert state.name == expected_name
+        if expected_name == "TimedOut":
+            assert state.is_failed()
+            assert f"exceeded timeout of {timeout_seconds} seconds" in state.message
+        else:
+            assert state.is_completed()
 
     async def test_async_flows_fail_with_timeout(self):
         @flow(timeout_seconds=0.1)
@@ -543,14 +591,6 @@ class TestFlowTimeouts:
         assert state.name == "TimedOut"
         assert "exceeded timeout of 0.1 seconds" in state.message
 
-    def test_timeout_only_applies_if_exceeded(self):
-        @flow(timeout_seconds=0.5)
-        def my_flow():
-            time.sleep(0.1)
-
-        state = my_flow()
-        assert state.is_completed()
-
     def test_timeout_does_not_wait_for_completion_for_sync_flows(self, tmp_path):
         """
         Sync flows are not cancellable, we can stop waiting for the worker thread but
@@ -574,8 +614,7 @@ class TestFlowTimeouts:
 
         # Unfortunately, the worker thread continues running and we cannot stop it from
         # doing so. The canary file _will_ be created.
-        time.sleep(1)
-        assert canary_file.exists()
+        assert wait_for_canary(canary_file)
 
     def test_timeout_stops_execution_at_next_task_for_sync_flows(self, tmp_path):
         """
@@ -600,10 +639,12 @@ class TestFlowTimeouts:
         assert "exceeded timeout of 0.1 seconds" in state.message
 
         # Wait in case the flow is just sleeping
-        time.sleep(0.5)
+        time.sleep(SETTLE_TIME)
 
-        assert not canary_file.exists()
-        assert not task_canary_file.exists()
+        # One directory scan checks both canaries instead of a stat apiece
+        names = {entry.name for entry in os.scandir(tmp_path)}
+        assert canary_file.name not in names
+        assert task_canary_file.name not in names
 
     async def test_timeout_stops_execution_after_await_for_async_flows(self, tmp_path):
         """
@@ -625,7 +666,7 @@ class TestFlowTimeouts:
         assert "exceeded timeout of 0.1 seconds" in state.message
 
         # Wait in case the flow is just sleeping
-        await anyio.sleep(1)
+        await anyio.sleep(2 * SETTLE_TIME)
 
         assert not canary_file.exists()
         assert t1 - t0 < 1.5, f"The engine returns without waiting; took {t1-t0}s"
@@ -687,7 +728,7 @@ class TestFlowTimeouts:
         assert "exceeded timeout of 0.1 seconds" in subflow_state.message
 
         # Wait in case the flow is just sleeping and will still create the canary
-        time.sleep(1)
+        time.sleep(2 * SETTLE_TIME)
 
         assert not canary_file.exists()
         assert runtime < 1, f"The engine returns without waiting; took {runtime}s"
@@ -706,12 +747,16 @@ class ParameterTestEnum(enum.Enum):
     Y = 2
 
 
+# Defined once at module scope; each decoration re-runs signature inspection
+# and hashes this whole file for the default version, so the identical
+# identity flow is shared across the parameter tests below
+@flow
+def identity_flow(x):
+    return x
+
+
 class TestFlowParameterTypes:
     def test_flow_parameters_cannot_be_unserialiable_types(self):
-        @flow
-        def my_flow(x):
-            return x
-
         with pytest.raises(
             ParameterTypeError,
             match=(
@@ -719,14 +764,10 @@ class TestFlowParameterTypes:
                 "Parameter 'x' is of unserializable type 'ParameterTestClass'"
             ),
         ):
-            my_flow(ParameterTestClass())
+            identity_flow(ParameterTestClass())
 
     def test_flow_parameters_can_be_pydantic_types(self):
-        @flow
-        def my_flow(x):
-            return x
-
-        assert my_flow(ParameterTestModel(data=1)).result() == ParameterTestModel(
+        assert identity_flow(ParameterTestModel(data=1)).result() == ParameterTestModel(
             data=1
         )
 
@@ -734,11 +775,7 @@ class TestFlowParameterTypes:
         "data", ([1, 2, 3], {"foo": "bar"}, {"x", "y"}, 1, "foo", ParameterTestEnum.X)
     )
     def test_flow_parameters_can_be_jsonable_python_types(self, data):
-        @flow
-        def my_flow(x):
-            return x
-
-        assert my_flow(data).result() == data
+        assert identity_flow(data).result() == data
 
     def test_subflow_parameters_cannot_be_unserialiable_types(self):
         @flow
@@ -853,7 +890,19 @@ class TestSubflowTaskInputs:
         )
 
 
+def logs_for_runs(*flow_run_ids):
+    """
+    Build a filter scoping a log read to the given flow runs so assertions do
+    not scan every log written earlier in the test session
+    """
+    return LogFilter(flow_run_id=dict(any_=list(flow_run_ids)))
+
+
+# Some log tests still assert over unfiltered `read_logs()` results, so they
+# must not interleave with each other; the xdist group pins them to one worker
+# when the suite is run with `pytest-xdist --dist=loadgroup`
 @pytest.mark.enable_orion_handler
+@pytest.mark.xdist_group("orion-logs")
 class TestFlowRunLogs:
     async def test_user_logs_are_sent_to_orion(self, orion_client):
         @flow
@@ -861,9 +910,11 @@ class TestFlowRunLogs:
             logger = get_run_logger()
             logger.info("Hello world!")
 
-        my_flow()
+        state = my_flow()
 
-        logs = await orion_client.read_logs()
+        logs = await orion_client.read_logs(
+            logs_for_runs(state.state_details.flow_run_id)
+        )
         assert "Hello world!" in {log.message for log in logs}
 
     async def test_repeated_flow_calls_send_logs_to_orion(self, orion_client):
@@ -872,10 +923,15 @@ class TestFlowRunLogs:
             logger = get_run_logger()
             logger.info(f"Hello {i}")
 
-        my_flow(1)
-        my_flow(2)
+        state_1 = my_flow(1)
+        state_2 = my_flow(2)
 
-        logs = await orion_client.read_logs()
+        logs = await orion_client.read_logs(
+            logs_for_runs(
+                state_1.state_details.flow_run_id,
+                state_2.state_details.flow_run_id,
+            )
+        )
         assert {"Hello 1", "Hello 2"}.issubset({log.message for log in logs})
 
     async def test_exception_info_is_included_in_log(self, orion_client):
@@ -887,9 +943,11 @@ class TestFlowRunLogs:
             except:
                 logger.error("There was an issue", exc_info=True)
 
-        my_flow()
+        state = my_flow()
 
-        logs = await orion_client.read_logs()
+        logs = await orion_client.read_logs(
+            logs_for_runs(state.state_details.flow_run_id)
+        )
         error_log = [log.message for log in logs if log.level == 40].pop()
         assert "Traceback" in error_log
         assert "NameError" in error_log, "References the exception type"
@@ -900,9 +958,11 @@ class TestFlowRunLogs:
         def my_flow():
             raise ValueError("Hello!")
 
-        my_flow()
+        state = my_flow()
 
-        logs = await orion_client.read_logs()
+        logs = await orion_client.read_logs(
+            logs_for_runs(state.state_details.flow_run_id)
+        )
         error_log = [log.message for log in logs if log.level == 40].pop()
         assert "Traceback" in error_log
         assert "ValueError: Hello!" in error_log, "References the exception"
@@ -916,9 +976,11 @@ class TestFlowRunLogs:
                 extra={"send_to_orion": False},
             )
 
-        my_flow()
+        state = my_flow()
 
-        logs = await orion_client.read_logs()
+        logs = await orion_client.read_logs(
+            logs_for_runs(state.state_details.flow_run_id)
+        )
         assert "Hello world!" not in {log.message for log in logs}
 
     async def test_logs_are_given_correct_id(self, orion_client):
@@ -936,6 +998,7 @@ class TestFlowRunLogs:
 
 
 @pytest.mark.enable_orion_handler
+@pytest.mark.xdist_group("orion-logs")
 class TestSubflowRunLogs:
     async def test_subflow_logs_are_written_correctly(self, orion_client):
         @flow
@@ -953,7 +1016,9 @@ class TestSubflowRunLogs:
         flow_run_id = state.state_details.flow_run_id
         subflow_run_id = state.result().state_details.flow_run_id
 
-        logs = await orion_client.read_logs()
+        logs = await orion_client.read_logs(
+            logs_for_runs(flow_run_id, subflow_run_id)
+        )
         assert all([log.task_run_id is None for log in logs])
         assert all([log.flow_run_id == flow_run_id for log in logs[:-1]])
         assert logs[-1].message == "Hello smaller world!"
@@ -981,7 +1046,9 @@ class TestSubflowRunLogs:
         flow_run_id = state.state_details.flow_run_id
         subflow_run_id = state.result().state_details.flow_run_id
 
-        logs = await orion_client.read_logs()
+        logs = await orion_client.read_logs(
+            logs_for_runs(flow_run_id, subflow_run_id)
+        )
         task_run_logs = [log for log in logs if log.task_run_id is not None]
         assert len(task_run_logs) == 1
         assert task_run_logs[0].flow_run_id == subflow_run_id
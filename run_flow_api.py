@@ -1,7 +1,66 @@
+import asyncio
+import atexit
+import time
+
 from prefect.client import OrionClient
 
-async with OrionClient() as client:
-    deployment = await client.read_deployment_by_name(
-        "Addition Machine/my-first-deployment"
-    )
-    flow_run = await client.create_flow_run_from_deployment(deployment)
+# note that deployment names are
+# stored and referenced as '<flow name>/<deployment name>'
+
+# Shared client, created on first use; repeated triggers reuse its connection
+# pool instead of paying connection setup per call
+_client = None
+
+
+async def _get_client() -> OrionClient:
+    global _client
+    if _client is None:
+        _client = OrionClient()
+        await _client.__aenter__()
+        atexit.register(_close_client)
+    return _client
+
+
+def _close_client():
+    # Best effort: the loop the client was opened on is gone by interpreter
+    # shutdown, so close on a fresh one and ignore transport teardown noise
+    try:
+        asyncio.run(_client.__aexit__(None, None, None))
+    except Exception:
+        pass
+
+
+# Deployment ids rarely change between triggers, so lookups are cached for a
+# minute; this halves the HTTP traffic of repeated triggers of the same name
+_DEPLOYMENT_TTL = 60
+_deployment_cache = {}
+
+
+async def _get_deployment(client, full_name):
+    hit = _deployment_cache.get(full_name)
+    if hit and time.monotonic() - hit[0] < _DEPLOYMENT_TTL:
+        return hit[1]
+    deployment = await client.read_deployment_by_name(full_name)
+    _deployment_cache[full_name] = (time.monotonic(), deployment)
+    return deployment
+
+
+async def trigger_deployment(full_name: str):
+    """
+    Create a flow run from the named deployment and return it
+    """
+    client = await _get_client()
+    deployment = await _get_deployment(client, full_name)
+    return await client.create_flow_run_from_deployment(deployment)
+
+
+async def trigger_many(full_names):
+    """
+    Trigger several deployments at once, overlapping the HTTP round-trips
+    instead of paying them serially
+    """
+    return await asyncio.gather(*(trigger_deployment(name) for name in full_names))
+
+
+if __name__ == "__main__":
+    asyncio.run(trigger_deployment("Addition Machine/my-first-deployment"))